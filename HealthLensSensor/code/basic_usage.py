@@ -7,25 +7,59 @@
 
 # ======================================== 导入相关模块 =========================================
 
-from machine import SoftI2C, Pin
+from machine import I2C, Pin
 from time import ticks_diff, ticks_us
 import time
+import sys
 from max30102 import MAX30102, MAX30105_PULSE_AMP_MEDIUM
 
 # ======================================== 全局变量 ============================================
 
+# 串口输出缓冲：逐样本写入 "red,ir\n" 的ASCII文本，每秒（或缓冲将满时）一次性输出
+line_buf = bytearray(2048)
+line_off = 0
+
 # ======================================== 功能函数 ============================================
 
+def write_uint(buf, off, value):
+    """
+    将非负整数value以十进制ASCII写入buf[off:]，返回写入后的偏移。
+    """
+    start = off
+    while True:
+        buf[off] = 48 + value % 10
+        value //= 10
+        off += 1
+        if value == 0:
+            break
+    # 数位为低位在前写入，原地逆序
+    end = off - 1
+    while start < end:
+        buf[start], buf[end] = buf[end], buf[start]
+        start += 1
+        end -= 1
+    return off
+
+def flush_lines():
+    """
+    将串口输出缓冲中的内容一次性写出并清空。
+    """
+    global line_off
+    if line_off:
+        sys.stdout.buffer.write(memoryview(line_buf)[:line_off])
+        line_off = 0
+
 # ======================================== 自定义类 ============================================
 
 # ======================================== 初始化配置 ==========================================
 
-# I2C软件实例
+# I2C硬件实例（由外设产生时钟，不占用CPU逐位翻转引脚）
 # I2C引脚配置：sda=Pin4, scl=Pin5
 # 快速模式：400kHz，慢速模式：100kHz
-i2c = SoftI2C(sda=Pin(4),
-              scl=Pin(5),
-              freq=400000)
+i2c = I2C(0,
+          sda=Pin(4),
+          scl=Pin(5),
+          freq=400000)
 
 # 传感器实例
 # 需要传入一个I2C实例
@@ -71,6 +105,12 @@ compute_frequency = True
 print("Starting data acquisition from RED & IR registers...", '\n')
 time.sleep(1)
 
+# 取样方法预先绑定，排空存储的循环中省去属性查找
+check = sensor.check
+available = sensor.available
+pop_red = sensor.pop_red_from_storage
+pop_ir = sensor.pop_ir_from_storage
+
 # 采集开始时间
 t_start = ticks_us()
 # 已采集的样本数
@@ -81,20 +121,27 @@ samples_n = 0
 while True:
     # 必须持续轮询check()方法，以检查传感器的FIFO队列中是否有新的读数
     # 当有新的读数可用时，此函数会将它们放入存储中
-    sensor.check()
+    check()
 
-    # 检查存储中是否包含可用样本
-    if sensor.available():
+    # 取空存储中的全部可用样本
+    while available():
         # 访问存储FIFO并收集读数（整数值）
-        red_reading = sensor.pop_red_from_storage()
-        ir_reading = sensor.pop_ir_from_storage()
-
-        # 打印采集的数据（以便用Serial Plotter绘制）
-        print(red_reading, ",", ir_reading)
+        red_reading = pop_red()
+        ir_reading = pop_ir()
+
+        # 采集的数据写入输出缓冲（以便用Serial Plotter绘制），不在每个样本上阻塞串口
+        line_off = write_uint(line_buf, line_off, red_reading)
+        line_buf[line_off] = 44  # ','
+        line_off = write_uint(line_buf, line_off + 1, ir_reading)
+        line_buf[line_off] = 10  # '\n'
+        line_off += 1
+        if line_off > len(line_buf) - 32:
+            flush_lines()
 
         # 计算我们接收数据的实际频率
         if compute_frequency:
             if ticks_diff(ticks_us(), t_start) >= 999999:
+                flush_lines()
                 f_HZ = samples_n
                 samples_n = 0
                 print("acquisition frequency = ", f_HZ)
@@ -13,7 +13,7 @@ __platform__ = "MicroPython v1.23.0"
 
 # ======================================== 导入相关模块 =========================================
 
-from ucollections import deque
+from array import array
 
 # ======================================== 全局变量 ============================================
 
@@ -23,39 +23,45 @@ from ucollections import deque
 
 class CircularBuffer(object):
     """
-    基于 deque 的简易环形缓冲区实现。
+    基于预分配 array('i') 的定长环形缓冲区实现。
 
     Attributes:
-        data (deque): 底层存储。
+        buf (array): 底层存储（有符号整数）。
+        head (int): 最早元素的下标。
+        tail (int): 下一个写入位置的下标。
+        count (int): 当前元素数量。
         max_size (int): 最大容量。
 
     Methods:
         append(item): 追加元素（满则丢弃最早元素）。
         pop(): 弹出最早元素。
-        pop_head(): 弹出最新元素（注意：原实现含边界逻辑）。
+        pop_head(): 弹出最新元素。
         clear(): 清空。
         is_empty(): 是否为空。
 
     Notes:
-        - 为保持与原代码逻辑一致，未更改 `pop_head` 的实现；其行为较非常规环形缓冲，使用时请注意。
+        - 仅存放整数（传感器样本），所有操作均为 O(1) 且不分配内存。
 
     =========================================
-    A minimal ring buffer backed by deque.
+    A fixed-capacity ring buffer backed by a preallocated array('i').
 
     Attributes:
-        data (deque): Underlying storage.
+        buf (array): Underlying storage (signed ints).
+        head (int): Index of the oldest element.
+        tail (int): Index of the next write position.
+        count (int): Number of stored elements.
         max_size (int): Capacity.
 
     Methods:
-       append(item): Append an element (if full, discard the earliest element).
+        append(item): Append an element (if full, discard the earliest element).
         pop(): Pop the earliest element.
-        pop_head(): Pop the latest element (Note: The original implementation includes boundary logic).
+        pop_head(): Pop the latest element.
         clear(): Clear all elements.
         is_empty(): Check if it is empty.
 
     Notes:
-        - The original `pop_head` behavior is preserved verbatim; it is unusual
-          for a ring buffer, so use with care.
+        - Stores integers only (sensor samples); every operation is O(1)
+          and allocation-free.
     """
     def __init__(self, max_size):
         """
@@ -78,7 +84,10 @@ class CircularBuffer(object):
             TypeError: If max_size is not an int.
             ValueError: If max_size is not positive.
         """
-        self.data = deque((), max_size, True)
+        self.buf = array('i', [0] * max_size)
+        self.head = 0
+        self.tail = 0
+        self.count = 0
         self.max_size = max_size
 
     def __len__(self):
@@ -94,7 +103,7 @@ class CircularBuffer(object):
         Returns:
             int: Count.
         """
-        return len(self.data)
+        return self.count
 
     def is_empty(self):
         """
@@ -109,76 +118,95 @@ class CircularBuffer(object):
            Returns:
                bool: True if empty.
         """
-        return not bool(self.data)
+        return self.count == 0
 
     def append(self, item):
         """
         追加元素；若满，则丢弃最早元素再插入。
 
         Args:
-            item (Any): 待插入元素。
+            item (int): 待插入元素。
 
         =========================================
         Append an item; drop the oldest if full.
 
         Args:
-            item (Any): Item to append.
+            item (int): Item to append.
         """
-        try:
-            self.data.append(item)
-        except IndexError:
-            # deque full, popping 1st item out
-            self.data.popleft()
-            self.data.append(item)
+        tail = self.tail
+        self.buf[tail] = item
+        tail += 1
+        if tail == self.max_size:
+            tail = 0
+        self.tail = tail
+        if self.count == self.max_size:
+            # 缓冲已满，最早元素被覆盖，head 跟随前移
+            self.head = tail
+        else:
+            self.count += 1
 
     def pop(self):
         """
         弹出最早的元素。
 
         Returns:
-            Any: 被弹出的元素。
+            int: 被弹出的元素。
+
+        Raises:
+            IndexError: 缓冲区为空。
 
         =========================================
         Pop the oldest element.
 
         Returns:
-            Any: Popped element.
+            int: Popped element.
+
+        Raises:
+            IndexError: If the buffer is empty.
         """
-        return self.data.popleft()
+        if self.count == 0:
+            raise IndexError('empty')
+        head = self.head
+        item = self.buf[head]
+        head += 1
+        if head == self.max_size:
+            head = 0
+        self.head = head
+        self.count -= 1
+        return item
 
     def clear(self):
         """
-        清空缓冲区。
+        清空缓冲区（复用已分配的存储，仅复位下标）。
 
         =========================================
-        Clear the buffer.
+        Clear the buffer (reuses the existing storage, only resets indices).
         """
-        self.data = deque((), self.max_size, True)
+        self.head = 0
+        self.tail = 0
+        self.count = 0
 
     def pop_head(self):
         """
-        弹出“最新”元素（保留原有实现特性）。
+        弹出最新元素。
 
         Returns:
-            Any|int: 若空返回 0，否则返回元素。
+            int: 若空返回 0，否则返回元素。
 
         =========================================
-        Pop the "newest" element (keeps original implementation semantics).
+        Pop the newest element.
 
         Returns:
-            Any|int: 0 if empty, els法 2：通过 GitHub 客户端e the element.
+            int: 0 if empty, else the element.
         """
-        buffer_size = len(self.data)
-        temp = self.data
-        if buffer_size == 1:
-            pass
-        elif buffer_size > 1:
-            self.data.clear()
-            for x in range(buffer_size - 1):
-                self.data = temp.popleft()
-        else:
+        if self.count == 0:
             return 0
-        return temp.popleft()
+        tail = self.tail - 1
+        if tail < 0:
+            tail = self.max_size - 1
+        self.tail = tail
+        self.count -= 1
+        return self.buf[tail]
 
     # ======================================== 初始化配置 ==========================================
 
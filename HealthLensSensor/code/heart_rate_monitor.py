@@ -14,13 +14,175 @@ __platform__ = "MicroPython v1.23.0"
 # ======================================== 导入相关模块 =========================================
 
 from time import ticks_diff , ticks_ms
+from ucollections import deque
+from array import array
+import micropython
+from micropython import const
 
 # ======================================== 全局变量 ============================================
 
+# 0.5~3.5 Hz 二阶巴特沃斯带通（fs=50 Hz，双线性变换），Q12 定点系数
+# H(z) = b0 * (1 - z^-2) / (1 + a1*z^-1 + a2*z^-2)
+_BP_B0 = const(656)
+_BP_A1 = const(-6784)
+_BP_A2 = const(2784)
+
+# main.py 使用的固定配置：采样率 50 Hz、3 秒峰值窗口、5 点平滑
+_RATE = const(50)
+_WINDOW = const(150)
+_SMOOTH = const(5)
+_INV_SMOOTH = 1.0 / _SMOOTH
+
 # ======================================== 功能函数 ============================================
 
+@micropython.viper
+def _smooth_push(buf: ptr32, state: ptr32, size: int, x: int) -> int:
+    """
+        将整数样本写入滑动平均环形窗口并更新累加和（viper 本地代码）。
+
+        Args:
+            buf (array): 长度为 size 的 array('i') 窗口。
+            state (array): array('i', [head, count, total]) 状态，原地更新。
+            size (int): 窗口长度。
+            x (int): 新样本。
+
+        Returns:
+            int: 更新后的窗口累加和。
+
+        =========================================
+        Push an integer sample into the moving-average ring window and update
+        the running sum (viper native code).
+
+        Args:
+            buf (array): array('i') window of length size.
+            state (array): array('i', [head, count, total]) updated in place.
+            size (int): Window length.
+            x (int): New sample.
+
+        Returns:
+            int: Updated window sum.
+    """
+    head = state[0]
+    count = state[1]
+    total = state[2]
+    if count >= size:
+        # 窗口已满，减去被覆盖的最早样本
+        total -= buf[head]
+    else:
+        count += 1
+    buf[head] = x
+    total += x
+    head += 1
+    if head >= size:
+        head = 0
+    state[0] = head
+    state[1] = count
+    state[2] = total
+    return total
+
+@micropython.viper
+def _bandpass_q12(state: ptr32, x: int) -> int:
+    """
+        整数带通滤波单步（Direct Form I，viper 本地代码）。
+
+        Args:
+            state (array): array('i', [x1, x2, y1, y2]) 滤波器状态，原地更新。
+            x (int): 新样本（18 位以内）。
+
+        Returns:
+            int: 滤波输出（以 0 为中心）。
+
+        =========================================
+        One step of the integer band-pass filter (Direct Form I, viper).
+
+        Args:
+            state (array): array('i', [x1, x2, y1, y2]) updated in place.
+            x (int): New sample (at most 18 bits).
+
+        Returns:
+            int: Filtered output (zero-centred).
+    """
+    y1 = state[2]
+    acc = _BP_B0 * (x - state[1]) - _BP_A1 * y1 - _BP_A2 * state[3]
+    y = (acc + 2048) >> 12
+    state[1] = state[0]
+    state[0] = x
+    state[3] = y1
+    state[2] = y
+    return y
+
 # ======================================== 自定义类 ============================================
 
+class BandpassFilter:
+    """
+    PPG 预滤波器：0.5~3.5 Hz 整数带通（对应 30~210 BPM），去除直流漂移与高频噪声。
+
+    Methods:
+        process(x): 滤波一个样本并返回结果。
+        reset(): 清除滤波器状态。
+
+    Notes:
+        - 系数按 50 Hz 采样率设计，与 main.py 中 400 SPS / 8 平均的配置一致。
+        - 首个样本用于预置状态，避免上电时的阶跃瞬态。
+
+    =========================================
+    PPG pre-filter: integer 0.5-3.5 Hz band-pass (30-210 BPM) that removes
+    DC drift and high-frequency noise.
+
+    Methods:
+        process(x): Filter one sample and return the result.
+        reset(): Clear the filter state.
+
+    Notes:
+        - Coefficients are designed for 50 Hz, matching the 400 SPS / 8
+          averaging configuration in main.py.
+        - The first sample primes the state to avoid a start-up step transient.
+    """
+    def __init__(self):
+        """
+            初始化滤波器状态。
+
+            =========================================
+            Initialize the filter state.
+        """
+        self._state = array('i', [0, 0, 0, 0])
+        self._primed = False
+
+    def reset(self):
+        """
+            清除滤波器状态，下一个样本将重新预置。
+
+            =========================================
+            Clear the filter state; the next sample primes it again.
+        """
+        state = self._state
+        state[0] = state[1] = state[2] = state[3] = 0
+        self._primed = False
+
+    def process(self, x):
+        """
+            滤波一个样本。
+
+            Args:
+                x (int): 原始样本（18 位以内的整数）。
+
+            Returns:
+                int: 带通输出。
+
+            =========================================
+            Filter one sample.
+
+            Args:
+                x (int): Raw sample (integer, at most 18 bits).
+
+            Returns:
+                int: Band-pass output.
+        """
+        if not self._primed:
+            self._state[0] = self._state[1] = x
+            self._primed = True
+        return _bandpass_q12(self._state, x)
+
 class HeartRateMonitor:
     """
     简易心率监测器：对输入样本做滑动窗口平滑与阈值峰值检测，估计 BPM。
@@ -29,18 +191,26 @@ class HeartRateMonitor:
         sample_rate (int): 采样率（Hz）。
         window_size (int): 峰值检测窗口大小（样本数）。
         smoothing_window (int): 平滑窗口大小（样本数）。
-        samples (list[float]): 原始样本序列。
-        timestamps (list[int]): 样本的时间戳（ms, 使用 time.ticks_ms）。
-        filtered_samples (list[float]): 平滑后的样本序列。
+        samples (array): 原始样本序列（array('i') 环形缓冲）。
+        timestamps (array): 样本的时间戳（ms, 使用 time.ticks_ms；array('i')）。
+        filtered_samples (array): 平滑后的样本序列（array('f')）。
+        head (int): 三个序列共用的最早样本下标，第 i 个样本为 buf[(head + i) % window_size]。
+        count (int): 序列中有效样本数（<= window_size）。
+        peaks (deque): 当前窗口内的峰值 (时间戳ms, 幅度)。
 
     Methods:
-        add_sample(sample): 添加一个样本并更新平滑序列。
-        find_peaks(): 在平滑序列中查找峰值点。
+        add_sample(sample, timestamp=None): 添加一个样本，更新平滑序列并增量检测峰值。
+        find_peaks(): 返回当前窗口内的峰值点。
         calculate_heart_rate(): 根据相邻峰值时间差计算 BPM。
 
     Notes:
         - 峰值阈值采用近期窗口的动态阈值（min/max 的 50% 中点）。
         - 需要至少两个峰值才能计算心率。
+        - 样本序列为共用下标的三个定长 array（结构数组），满后覆盖最早元素；平滑窗口为 array('i') 环形缓冲，
+          整数滑动和由 viper 函数 _smooth_push 维护，单次更新为 O(1)。
+        - 平滑前样本取整（IR 读数本身为 18 位整数）。
+        - 窗口 min/max 由单调队列维护，峰值在 add_sample 中逐点判定，无需整窗重扫。
+        - 心率由最近 8 个峰值间隔的滑动和计算，不再每次遍历峰值列表。
 
     =========================================
     A light-weight HR monitor performing moving-window smoothing and threshold
@@ -50,18 +220,32 @@ class HeartRateMonitor:
         sample_rate (int): Sampling rate in Hz.
         window_size (int): Peak detection window length in samples.
         smoothing_window (int): Moving average window length.
-        samples (list[float]): Raw samples.
-        timestamps (list[int]): Sample timestamps in ms (time.ticks_ms).
-        filtered_samples (list[float]): Smoothed samples.
+        samples (array): Raw samples (array('i') ring buffer).
+        timestamps (array): Sample timestamps in ms (time.ticks_ms, array('i')).
+        filtered_samples (array): Smoothed samples (array('f')).
+        head (int): Shared index of the oldest sample; the i-th sample is
+            buf[(head + i) % window_size].
+        count (int): Number of valid samples (<= window_size).
+        peaks (deque): Peaks inside the current window as (timestamp_ms, amplitude).
 
     Methods:
-        add_sample(sample): Append a sample and update the smoothed list.
-        find_peaks(): Detect peaks on the smoothed series.
+        add_sample(sample, timestamp=None): Append a sample, update smoothing and detect peaks incrementally.
+        find_peaks(): Return the peaks inside the current window.
         calculate_heart_rate(): Compute BPM from peak intervals.
 
     Notes:
         - The threshold is 50% between min and max of the recent window.
         - At least two peaks are required to compute BPM.
+        - Sample series are three parallel fixed-size arrays sharing one
+          index (struct of arrays) that overwrite the oldest item when full;
+          the smoothing window is an array('i') ring whose integer
+          running sum is maintained by the viper helper _smooth_push (O(1)).
+        - Samples are truncated to int before smoothing (IR readings are
+          18-bit integers already).
+        - Window min/max are tracked with monotonic queues and peaks are
+          decided per sample in add_sample, so no full-window rescan is needed.
+        - BPM comes from a running sum of the last 8 peak intervals instead
+          of walking the peak list on every call.
     """
     def __init__(self, sample_rate=100, window_size=10, smoothing_window=5):
         """
@@ -89,16 +273,41 @@ class HeartRateMonitor:
         self.sample_rate = sample_rate
         self.window_size = window_size
         self.smoothing_window = smoothing_window
-        self.samples = []
-        self.timestamps = []
-        self.filtered_samples = []
-
-    def add_sample(self, sample):
+        # 共用下标的定长环形缓冲（结构数组），满后覆盖最早元素
+        self.samples = array('i', [0] * window_size)
+        self.timestamps = array('i', [0] * window_size)
+        self.filtered_samples = array('f', [0.0] * window_size)
+        self.head = 0
+        self.count = 0
+        # 滑动平均的整数环形窗口及状态 [head, count, total]
+        self._smooth_buf = array('i', [0] * smoothing_window)
+        self._smooth_state = array('i', [0, 0, 0])
+        # 平滑窗口填满后以乘法代替除法
+        self._inv_smooth = 1.0 / smoothing_window
+        # 样本序号，用于判断单调队列与峰值是否已滑出窗口
+        self._count = 0
+        # 单调队列：窗口内最大值（递减）与最小值（递增），索引与数值分开存放
+        self._max_idx = deque((), window_size)
+        self._max_val = deque((), window_size)
+        self._min_idx = deque((), window_size)
+        self._min_val = deque((), window_size)
+        # 最近三个平滑值及中间点的时间戳
+        self._last3 = [None, None, None]
+        self._prev_ts = 0
+        # 窗口内峰值（相邻两点不可能同为峰值，容量取一半即可）
+        self.peaks = deque((), window_size // 2 + 1)
+        self._peak_idx = deque((), window_size // 2 + 1)
+        # 最近若干个相邻峰值间隔（ms）及其累加和
+        self._intervals = deque((), 8)
+        self._interval_sum = 0
+
+    def add_sample(self, sample, timestamp=None):
         """
             添加一个新样本并更新平滑结果。
 
             Args:
                 sample (float|int): 原始样本值。
+                timestamp (int|None): 样本时间戳（ms, time.ticks_ms 时基）；为 None 时取当前时间。
             Raises:
                 TypeError: 如果 sample 不是 int 或 float。
             =========================================
@@ -106,67 +315,115 @@ class HeartRateMonitor:
 
             Args:
                 sample (float|int): Raw sample value.
+                timestamp (int|None): Sample timestamp in ms (time.ticks_ms base);
+                    the current time is used when None.
             Raises:
                 TypeError: If sample is not int or float.
         """
-        timestamp = ticks_ms()
-        self.samples.append(sample)
-        self.timestamps.append(timestamp)
-
-        # Apply smoothing
-        if len(self.samples) >= self.smoothing_window:
-            smoothed_sample = (
-                sum(self.samples[-self.smoothing_window :]) / self.smoothing_window
-            )
-            self.filtered_samples.append(smoothed_sample)
+        if timestamp is None:
+            timestamp = ticks_ms()
+        x = int(sample)
+
+        # 滑动平均：整数窗口与累加和在 viper 中更新
+        state = self._smooth_state
+        smoothing_window = self.smoothing_window
+        total = _smooth_push(self._smooth_buf, state, smoothing_window, x)
+        n = state[1]
+        filtered = total * self._inv_smooth if n == smoothing_window else total / n
+
+        # 写入结构数组：未满时写在末尾，已满时覆盖最早样本并前移 head
+        window_size = self.window_size
+        count = self.count
+        if count < window_size:
+            pos = self.head + count
+            if pos >= window_size:
+                pos -= window_size
+            self.count = count + 1
         else:
-            self.filtered_samples.append(sample)
-
-        # 维护样本和时间戳的大小
-        if len(self.samples) > self.window_size:
-            self.samples.pop(0)
-            self.timestamps.pop(0)
-            self.filtered_samples.pop(0)
+            pos = self.head
+            head = pos + 1
+            self.head = 0 if head >= window_size else head
+        self.samples[pos] = x
+        self.timestamps[pos] = timestamp
+        self.filtered_samples[pos] = filtered
+
+        idx = self._count
+        self._count = idx + 1
+        # 窗口为 [idx - window_size + 1, idx]
+        expired = idx - window_size
+
+        # 更新窗口最大值单调队列
+        max_idx = self._max_idx
+        max_val = self._max_val
+        while max_val and max_val[-1] <= filtered:
+            max_val.pop()
+            max_idx.pop()
+        max_idx.append(idx)
+        max_val.append(filtered)
+        if max_idx[0] <= expired:
+            max_idx.popleft()
+            max_val.popleft()
+
+        # 更新窗口最小值单调队列
+        min_idx = self._min_idx
+        min_val = self._min_val
+        while min_val and min_val[-1] >= filtered:
+            min_val.pop()
+            min_idx.pop()
+        min_idx.append(idx)
+        min_val.append(filtered)
+        if min_idx[0] <= expired:
+            min_idx.popleft()
+            min_val.popleft()
+
+        # 三点法判定中间点是否为峰值，阈值为窗口 min/max 的 50% 中点
+        last3 = self._last3
+        last3[0] = last3[1]
+        last3[1] = last3[2]
+        last3[2] = filtered
+        if last3[0] is not None:
+            mid = last3[1]
+            threshold = min_val[0] + (max_val[0] - min_val[0]) * 0.5
+            if mid > threshold and last3[0] < mid and mid > filtered:
+                peak_ts = self._prev_ts
+                intervals = self._intervals
+                if self.peaks:
+                    # 与上一峰值的间隔计入滑动和，队列满时先减去最早间隔
+                    dt = ticks_diff(peak_ts, self.peaks[-1][0])
+                    if len(intervals) >= 8:
+                        self._interval_sum -= intervals.popleft()
+                    intervals.append(dt)
+                    self._interval_sum += dt
+                else:
+                    # 窗口内已无峰值（信号中断），丢弃旧的间隔
+                    while intervals:
+                        intervals.popleft()
+                    self._interval_sum = 0
+                self.peaks.append((peak_ts, mid))
+                self._peak_idx.append(idx - 1)
+        self._prev_ts = timestamp
+
+        # 丢弃已滑出窗口的峰值（窗口首个样本没有左邻点，不计为峰值）
+        peak_idx = self._peak_idx
+        while peak_idx and peak_idx[0] <= expired + 1:
+            peak_idx.popleft()
+            self.peaks.popleft()
 
     def find_peaks(self):
         """
-            在平滑序列中查找峰值（基于动态阈值的三点法）。
+            返回当前窗口内的峰值（基于动态阈值的三点法，已在 add_sample 中增量判定）。
 
             Returns:
                 list[tuple[int, float]]: 峰值列表，每项为 (时间戳ms, 峰值幅度)。
 
             =========================================
-            Find peaks on the smoothed samples using a simple three-point test with
-            a dynamic threshold.
+            Return peaks inside the current window (three-point test with a
+            dynamic threshold, decided incrementally in add_sample).
 
             Returns:
                 list[tuple[int, float]]: Peaks as (timestamp_ms, amplitude).
         """
-        peaks = []
-
-        # 需要至少三个样本来寻找峰值
-        if len(self.filtered_samples) < 3:
-            return peaks
-
-        # 基于最近窗口的滤波样本的最小值和最大值计算动态阈值
-        recent_samples = self.filtered_samples[-self.window_size:]
-        min_val = min(recent_samples)
-        max_val = max(recent_samples)
-        # 以最小值和最大值的50%作为阈值
-        threshold = (
-                min_val + (max_val - min_val) * 0.5
-        )
-
-        for i in range(1, len(self.filtered_samples) - 1):
-            if (
-                    self.filtered_samples[i] > threshold
-                    and self.filtered_samples[i - 1] < self.filtered_samples[i]
-                    and self.filtered_samples[i] > self.filtered_samples[i + 1]
-            ):
-                peak_time = self.timestamps[i]
-                peaks.append((peak_time, self.filtered_samples[i]))
-
-        return peaks
+        return list(self.peaks)
 
     def calculate_heart_rate(self):
         """
@@ -181,27 +438,44 @@ class HeartRateMonitor:
             Returns:
                 float|None: BPM or None if not enough peaks are found.
         """
-        peaks = self.find_peaks()
-
         # 峰值不足，无法计算心率
-        if len(peaks) < 2:
+        if len(self.peaks) < 2 or self._interval_sum <= 0:
             return None
 
-        # 计算峰值之间的平均间隔（毫秒）
-        intervals = []
-        for i in range(1, len(peaks)):
-            interval = ticks_diff(peaks[i][0], peaks[i - 1][0])
-            intervals.append(interval)
+        # 由最近峰值间隔的滑动和求平均间隔，再换算为 BPM
+        # 60秒每分钟 * 1000毫秒每秒
+        return 60000 * len(self._intervals) / self._interval_sum
 
-        average_interval = sum(intervals) / len(intervals)
 
-        # 将间隔转换为每分钟心跳数（BPM）
-        # 60秒每分钟 * 1000毫秒每秒
-        heart_rate = (
-                60000 / average_interval
-        )
+class HeartRateMonitor50(HeartRateMonitor):
+    """
+    固定配置的心率监测器：50 Hz 采样、150 点（3 秒）峰值窗口、5 点平滑。
+
+    Notes:
+        - 参数取自模块级 const()，平滑倒数取预先算好的 _INV_SMOOTH；
+          add_sample 沿用基类实现，窗口参数在每次调用开头一次性绑定为局部变量。
+        - 需要其他采样率时使用参数化的 HeartRateMonitor。
+
+    =========================================
+    Heart-rate monitor with a fixed configuration: 50 Hz sampling, a
+    150-sample (3 s) peak window and 5-point smoothing.
 
-        return heart_rate
+    Notes:
+        - Parameters come from module-level const() values and the smoothing
+          reciprocal from the precomputed _INV_SMOOTH; add_sample is the base
+          implementation, which binds the window parameters to locals once
+          per call.
+        - Use the parameterized HeartRateMonitor for other sample rates.
+    """
+    def __init__(self):
+        """
+            按固定配置初始化。
+
+            =========================================
+            Initialize with the fixed configuration.
+        """
+        super().__init__(sample_rate=_RATE, window_size=_WINDOW, smoothing_window=_SMOOTH)
+        self._inv_smooth = _INV_SMOOTH
 
     # ======================================== 初始化配置 ==========================================
 
@@ -3,7 +3,7 @@ import os
 from machine import I2C, Pin, SoftI2C
 from mlx90614 import MLX90614
 from max30102 import MAX30102, MAX30105_PULSE_AMP_MEDIUM
-from heart_rate_monitor import HeartRateMonitor
+from heart_rate_monitor import HeartRateMonitor50, BandpassFilter
 from ssd1306 import SSD1306_I2C
 
 
@@ -47,19 +47,90 @@ else:
     hr_sensor.set_sample_rate(400)
     hr_sensor.set_fifo_average(8)
     hr_sensor.set_active_leds_amplitude(MAX30105_PULSE_AMP_MEDIUM)
+    # FIFO剩余15个空位（即已存17个样本）时拉低INT引脚
+    hr_sensor.set_fifo_almost_full(0x0F)
+    hr_sensor.enable_a_full()
+
+# MAX30102 INT引脚（开漏、低电平有效），下降沿置位标志，主循环据此读取FIFO
+# 初值为True：启动后先读一次，清除上电期间可能已挂起的中断
+hr_int_flag = True
+
+def hr_int_handler(pin):
+    global hr_int_flag
+    hr_int_flag = True
+
+if hr_sensor:
+    hr_int_pin = Pin(7, Pin.IN, Pin.PULL_UP)
+    hr_int_pin.irq(trigger=Pin.IRQ_FALLING, handler=hr_int_handler)
 
 # 初始化心率监测器
 actual_rate = 400 // 8
-hr_monitor = HeartRateMonitor(sample_rate=actual_rate, window_size=actual_rate * 3)
+hr_monitor = HeartRateMonitor50()
+# 相邻样本的时间间隔（ms），用于还原一次突发读取中各样本的时间戳
+sample_period_ms = 1000 // actual_rate
+# IR信号先经0.5~3.5 Hz带通去除直流漂移，再送入心率监测器
+hr_filter = BandpassFilter()
+# 逐样本调用的方法预先绑定，FIFO解码循环中省去属性查找
+add_hr_sample = hr_monitor.add_sample
+filter_ir = hr_filter.process
 
-# 心率计算间隔
-hr_interval = 2
+# 心率计算间隔（ms）
+hr_interval_ms = 2000
 last_hr_time = time.ticks_ms()
 
-# 显示更新间隔
-display_interval = 1  # 每秒更新一次显示
+# 显示更新间隔（ms）
+display_interval_ms = 1000  # 每秒更新一次显示
 last_display_time = time.ticks_ms()
 
+# OLED标题（预先编码为bytes，framebuf.text可直接使用）
+TITLE_TEXT = b"Health Monitoring System"
+
+# OLED数字逐字符绘制：单字符常量表 + 预分配的数位缓冲，避免每帧格式化字符串
+DIGIT_CHARS = ('0', '1', '2', '3', '4', '5', '6', '7', '8', '9')
+digit_buf = bytearray(8)
+
+def draw_number(value, x, y, decimals=0):
+    """
+    在OLED (x, y) 处绘制整数value，末尾decimals位作为小数部分，返回结束处的x坐标。
+    例如 draw_number(365, x, y, 1) 显示 "36.5"。
+    """
+    if value < 0:
+        oled.text('-', x, y)
+        x += 8
+        value = -value
+    n = 0
+    while True:
+        digit_buf[n] = value % 10
+        value //= 10
+        n += 1
+        if value == 0 and n > decimals:
+            break
+    for i in range(n - 1, -1, -1):
+        oled.text(DIGIT_CHARS[digit_buf[i]], x, y)
+        x += 8
+        if i == decimals and decimals:
+            oled.text('.', x, y)
+            x += 8
+    return x
+
+# FIFO突发读取缓冲：32个样本 × 每样本字节数（由驱动按当前LED模式给出，active_leds*3）
+fifo_stride = hr_sensor._multi_led_read_mode if hr_sensor else 0
+fifo_buf = bytearray(32 * fifo_stride)
+# 样本解码同样预先绑定驱动方法
+fifo_to_int = hr_sensor.fifo_bytes_to_int if hr_sensor else None
+
+# 最近一次从FIFO取出的红光/红外读数，供1 Hz显示分支计算血氧
+last_red = 0
+last_ir = 0
+
+# 最近一次心率计算结果，None表示尚未得到有效心率
+heart_rate = None
+
+# OLED上次绘制的 (体温x10, 心率, 血氧x10)，数值不变时跳过重绘与刷新
+last_drawn = (None, None, None)
+# 标题与分隔线等静态内容是否已绘制
+frame_drawn = False
+
 print("开始读取温度和心率数据...")
 
 # 显示初始信息
@@ -72,66 +143,98 @@ try:
     while True:
         current_time = time.ticks_ms()
         
-        # 处理MAX30102数据
-        if hr_sensor:
-            hr_sensor.check()
-            if hr_sensor.available():
-                red = hr_sensor.pop_red_from_storage()
-                ir = hr_sensor.pop_ir_from_storage()
-                hr_monitor.add_sample(ir)
+        # 处理MAX30102数据：仅在INT中断置位后读取，一次取空FIFO中的全部样本
+        if hr_sensor and hr_int_flag:
+            hr_int_flag = False
+            # 读中断状态寄存器以释放INT引脚
+            hr_sensor.get_int_1()
+            # 一次I2C事务读出FIFO中全部样本，再在本地解码
+            # 每个样本依次为红光、红外各3字节，经驱动解码并按当前脉宽右移，与check()路径的数值尺度一致
+            n = hr_sensor.read_fifo_burst(fifo_buf)
+            off = 0
+            # 复用本轮循环的current_time，最后一个样本记为当前时刻，之前的按采样周期依次前推
+            ts = time.ticks_add(current_time, -(n - 1) * sample_period_ms)
+            for _ in range(n):
+                last_red = fifo_to_int(fifo_buf, off)
+                last_ir = fifo_to_int(fifo_buf, off + 3)
+                add_hr_sample(filter_ir(last_ir), ts)
+                off += fifo_stride
+                ts = time.ticks_add(ts, sample_period_ms)
         
         # 计算心率
-        if hr_sensor and time.ticks_diff(current_time, last_hr_time) / 1000 > hr_interval:
+        if hr_sensor and time.ticks_diff(current_time, last_hr_time) > hr_interval_ms:
             heart_rate = hr_monitor.calculate_heart_rate()
             last_hr_time = current_time
-        if ir:
-            blood_oxygen = 100 - 25 * (red / ir)
         
         # 更新OLED显示
-        if oled and time.ticks_diff(current_time, last_display_time) / 1000 > display_interval:
+        if oled and time.ticks_diff(current_time, last_display_time) > display_interval_ms:
             # 读取温度
             ambient = temp_sensor.read_ambient()
             body = temp_sensor.read_object()
             
-            # 清屏
-            oled.fill(0)
-            
-            # 显示标题
-            oled.text("Health Monitoring System", 10, 0)
-            oled.hline(0, 10, 128, 1)
-            
-            
-            # 显示人体温度
-            body_str = f"body: {body:.1f}C"
-            oled.text(body_str, 0, 15)
-            
-            # 显示心率
-            if hr_sensor and 'heart_rate' in locals() and heart_rate is not None:
-                hr_str = f"heart_rate: {heart_rate:.0f} BPM"
+            # 整数化后的显示值，用于判断是否需要重绘
+            body_x10 = round(body * 10)
+            if hr_sensor and heart_rate is not None:
+                hr_bpm = round(heart_rate)
             else:
-                hr_str = "heart_rate: -- BPM"
-            oled.text(hr_str, 0, 30)
-            
-            blood_oxygen = f"oxygen: {blood_oxygen:.1f}%"
-            oled.text(blood_oxygen, 0, 45)
-            # 显示分隔线
-            oled.hline(0, 55, 128, 1)
-            
-            
-            # 更新显示
-            oled.show()
+                hr_bpm = -1
+            # 血氧（仅在显示时用最近一次读数计算）
+            spo2 = 100 - 25 * (last_red / last_ir) if last_ir else 0.0
+            spo2_x10 = round(spo2 * 10)
+
+            if not frame_drawn:
+                # 首次显示：清屏并绘制标题与分隔线
+                oled.fill(0)
+                oled.text(TITLE_TEXT, 10, 0)
+                oled.hline(0, 10, 128, 1)
+                oled.hline(0, 55, 128, 1)
+                frame_drawn = True
+
+            # 仅重绘数值发生变化的行
+            changed = False
+            if body_x10 != last_drawn[0]:
+                oled.fill_rect(0, 15, 128, 8, 0)
+                oled.text("body: ", 0, 15)
+                x = draw_number(body_x10, 48, 15, 1)
+                oled.text("C", x, 15)
+                changed = True
+
+            if hr_bpm != last_drawn[1]:
+                oled.fill_rect(0, 30, 128, 8, 0)
+                oled.text("heart_rate: ", 0, 30)
+                if hr_bpm >= 0:
+                    x = draw_number(hr_bpm, 96, 30)
+                else:
+                    oled.text("--", 96, 30)
+                    x = 112
+                oled.text(" BPM", x, 30)
+                changed = True
+
+            if spo2_x10 != last_drawn[2]:
+                oled.fill_rect(0, 45, 128, 8, 0)
+                oled.text("oxygen: ", 0, 45)
+                x = draw_number(spo2_x10, 64, 45, 1)
+                oled.text("%", x, 45)
+                changed = True
+
+            # 有变化时才通过I2C推送帧缓冲
+            if changed:
+                oled.show()
+                last_drawn = (body_x10, hr_bpm, spo2_x10)
             
             # 打印到串口
             print(f"环境温度: {ambient:.1f}°C")
             print(f"人体温度: {body:.1f}°C")
-            if hr_sensor and 'heart_rate' in locals() and heart_rate is not None:
+            if hr_sensor and heart_rate is not None:
                 print(f"心率: {heart_rate:.0f} BPM")
             else:
                 print("心率: 正在计算...")
             print("-" * 20)
             
             last_display_time = current_time
-            
+
+        # 无数据时让出CPU，等待下一次中断
+        time.sleep_ms(5)
 
 except KeyboardInterrupt:
     print("程序结束")
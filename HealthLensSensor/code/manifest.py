@@ -0,0 +1,13 @@
+# Python env   : MicroPython v1.23.0
+# -*- coding: utf-8 -*-
+# @Time    : 2025/09/16 18:00
+# @Author  : 侯钧瀚
+# @File    : manifest.py
+# @Description : 固件冻结清单：将 MAX30102 驱动及其依赖以 -O3 预编译冻结进固件，省去上电时的源码解析
+# @License : MIT
+
+# 用法：在板级 manifest 中 include("<本目录>/manifest.py")，再重新编译固件；
+# 冻结后直接 import max30102 即从固件加载，无需再把这些 .py 拷贝到文件系统
+# （文件系统中的同名 .py 会优先于冻结模块被导入，需删除）。
+
+freeze(".", ("circular_buffer.py", "max30102.py"), opt=3)
@@ -14,137 +14,244 @@ __platform__ = "MicroPython v1.23.0"
 
 # ======================================== 导入相关模块 =========================================
 
+import micropython
+from micropython import const
 from machine import SoftI2C
-from ustruct import unpack
-from time import sleep_ms, ticks_diff, ticks_ms
+from time import sleep_ms, ticks_add, ticks_diff, ticks_ms
 from circular_buffer import CircularBuffer
 
 # ======================================== 全局变量 ============================================
 
-MAX3010X_I2C_ADDRESS = 0x57  
-
-MAX30105_INT_STAT_1 = 0x00
-MAX30105_INT_STAT_2 = 0x01
-MAX30105_INT_ENABLE_1 = 0x02
-MAX30105_INT_ENABLE_2 = 0x03
-
-MAX30105_FIFO_WRITE_PTR = 0x04
-MAX30105_FIFO_OVERFLOW = 0x05
-MAX30105_FIFO_READ_PTR = 0x06
-MAX30105_FIFO_DATA = 0x07
-
-MAX30105_FIFO_CONFIG = 0x08
-MAX30105_MODE_CONFIG = 0x09
-MAX30105_PARTICLE_CONFIG = 0x0A  
-MAX30105_LED1_PULSE_AMP = 0x0C  
-MAX30105_LED2_PULSE_AMP = 0x0D  
-MAX30105_LED3_PULSE_AMP = 0x0E  
-MAX30105_LED_PROX_AMP = 0x10
-MAX30105_MULTI_LED_CONFIG_1 = 0x11
-MAX30105_MULTI_LED_CONFIG_2 = 0x12
-
-MAX30105_DIE_TEMP_INT = 0x1F
-MAX30105_DIE_TEMP_FRAC = 0x20
-MAX30105_DIE_TEMP_CONFIG = 0x21
-
-MAX30105_PROX_INT_THRESH = 0x30
-
-MAX30105_REVISION_ID = 0xFE
-MAX30105_PART_ID = 0xFF  
-
-MAX30105_INT_A_FULL_MASK = ~0b10000000
-MAX30105_INT_A_FULL_ENABLE = 0x80
-MAX30105_INT_A_FULL_DISABLE = 0x00
-
-MAX30105_INT_DATA_RDY_MASK = ~0b01000000
-MAX30105_INT_DATA_RDY_ENABLE = 0x40
-MAX30105_INT_DATA_RDY_DISABLE = 0x00
-
-MAX30105_INT_ALC_OVF_MASK = ~0b00100000
-MAX30105_INT_ALC_OVF_ENABLE = 0x20
-MAX30105_INT_ALC_OVF_DISABLE = 0x00
-
-MAX30105_INT_PROX_INT_MASK = ~0b00010000
-MAX30105_INT_PROX_INT_ENABLE = 0x10
-MAX30105_INT_PROX_INT_DISABLE = 0x00
-
-MAX30105_INT_DIE_TEMP_RDY_MASK = ~0b00000010
-MAX30105_INT_DIE_TEMP_RDY_ENABLE = 0x02
-MAX30105_INT_DIE_TEMP_RDY_DISABLE = 0x00
-
-
-MAX30105_SAMPLE_AVG_MASK = ~0b11100000
-MAX30105_SAMPLE_AVG_1 = 0x00
-MAX30105_SAMPLE_AVG_2 = 0x20
-MAX30105_SAMPLE_AVG_4 = 0x40
-MAX30105_SAMPLE_AVG_8 = 0x60
-MAX30105_SAMPLE_AVG_16 = 0x80
-MAX30105_SAMPLE_AVG_32 = 0xA0
-
-MAX30105_ROLLOVER_MASK = 0xEF
-MAX30105_ROLLOVER_ENABLE = 0x10
-MAX30105_ROLLOVER_DISABLE = 0x00
-
-MAX30105_A_FULL_MASK = 0xF0
-
-
-MAX30105_SHUTDOWN_MASK = 0x7F
-MAX30105_SHUTDOWN = 0x80
-MAX30105_WAKEUP = 0x00
-MAX30105_RESET_MASK = 0xBF
-MAX30105_RESET = 0x40
-
-MAX30105_MODE_MASK = 0xF8
-MAX30105_MODE_RED_ONLY = 0x02
-MAX30105_MODE_RED_IR_ONLY = 0x03
-MAX30105_MODE_MULTI_LED = 0x07
-
-MAX30105_ADC_RANGE_MASK = 0x9F
-MAX30105_ADC_RANGE_2048 = 0x00
-MAX30105_ADC_RANGE_4096 = 0x20
-MAX30105_ADC_RANGE_8192 = 0x40
-MAX30105_ADC_RANGE_16384 = 0x60
-
-MAX30105_SAMPLERATE_MASK = 0xE3
-MAX30105_SAMPLERATE_50 = 0x00
-MAX30105_SAMPLERATE_100 = 0x04
-MAX30105_SAMPLERATE_200 = 0x08
-MAX30105_SAMPLERATE_400 = 0x0C
-MAX30105_SAMPLERATE_800 = 0x10
-MAX30105_SAMPLERATE_1000 = 0x14
-MAX30105_SAMPLERATE_1600 = 0x18
-MAX30105_SAMPLERATE_3200 = 0x1C
-
-MAX30105_PULSE_WIDTH_MASK = 0xFC
-MAX30105_PULSE_WIDTH_69 = 0x00
-MAX30105_PULSE_WIDTH_118 = 0x01
-MAX30105_PULSE_WIDTH_215 = 0x02
-MAX30105_PULSE_WIDTH_411 = 0x03
-
-MAX30105_PULSE_AMP_LOWEST = 0x02  
-MAX30105_PULSE_AMP_LOW = 0x1F  
-MAX30105_PULSE_AMP_MEDIUM = 0x7F  
-MAX30105_PULSE_AMP_HIGH = 0xFF  
-
-MAX30105_SLOT1_MASK = 0xF8
-MAX30105_SLOT2_MASK = 0x8F
-MAX30105_SLOT3_MASK = 0xF8
-MAX30105_SLOT4_MASK = 0x8F
-SLOT_NONE = 0x00
-SLOT_RED_LED = 0x01
-SLOT_IR_LED = 0x02
-SLOT_GREEN_LED = 0x03
-SLOT_NONE_PILOT = 0x04
-SLOT_RED_PILOT = 0x05
-SLOT_IR_PILOT = 0x06
-SLOT_GREEN_PILOT = 0x07
-
-MAX_30105_EXPECTED_PART_ID = 0x15
-
-STORAGE_QUEUE_SIZE = 4
+MAX3010X_I2C_ADDRESS = const(0x57)
+
+MAX30105_INT_STAT_1 = const(0x00)
+MAX30105_INT_STAT_2 = const(0x01)
+MAX30105_INT_ENABLE_1 = const(0x02)
+MAX30105_INT_ENABLE_2 = const(0x03)
+
+MAX30105_FIFO_WRITE_PTR = const(0x04)
+MAX30105_FIFO_OVERFLOW = const(0x05)
+MAX30105_FIFO_READ_PTR = const(0x06)
+MAX30105_FIFO_DATA = const(0x07)
+
+MAX30105_FIFO_CONFIG = const(0x08)
+MAX30105_MODE_CONFIG = const(0x09)
+MAX30105_PARTICLE_CONFIG = const(0x0A)
+MAX30105_LED1_PULSE_AMP = const(0x0C)
+MAX30105_LED2_PULSE_AMP = const(0x0D)
+MAX30105_LED3_PULSE_AMP = const(0x0E)
+MAX30105_LED_PROX_AMP = const(0x10)
+MAX30105_MULTI_LED_CONFIG_1 = const(0x11)
+MAX30105_MULTI_LED_CONFIG_2 = const(0x12)
+
+MAX30105_DIE_TEMP_INT = const(0x1F)
+MAX30105_DIE_TEMP_FRAC = const(0x20)
+MAX30105_DIE_TEMP_CONFIG = const(0x21)
+
+MAX30105_PROX_INT_THRESH = const(0x30)
+
+MAX30105_REVISION_ID = const(0xFE)
+MAX30105_PART_ID = const(0xFF)
+
+MAX30105_INT_A_FULL_MASK = const(~0b10000000)
+MAX30105_INT_A_FULL_ENABLE = const(0x80)
+MAX30105_INT_A_FULL_DISABLE = const(0x00)
+
+MAX30105_INT_DATA_RDY_MASK = const(~0b01000000)
+MAX30105_INT_DATA_RDY_ENABLE = const(0x40)
+MAX30105_INT_DATA_RDY_DISABLE = const(0x00)
+
+MAX30105_INT_ALC_OVF_MASK = const(~0b00100000)
+MAX30105_INT_ALC_OVF_ENABLE = const(0x20)
+MAX30105_INT_ALC_OVF_DISABLE = const(0x00)
+
+MAX30105_INT_PROX_INT_MASK = const(~0b00010000)
+MAX30105_INT_PROX_INT_ENABLE = const(0x10)
+MAX30105_INT_PROX_INT_DISABLE = const(0x00)
+
+MAX30105_INT_DIE_TEMP_RDY_MASK = const(~0b00000010)
+MAX30105_INT_DIE_TEMP_RDY_ENABLE = const(0x02)
+MAX30105_INT_DIE_TEMP_RDY_DISABLE = const(0x00)
+
+
+MAX30105_SAMPLE_AVG_MASK = const(~0b11100000)
+MAX30105_SAMPLE_AVG_1 = const(0x00)
+MAX30105_SAMPLE_AVG_2 = const(0x20)
+MAX30105_SAMPLE_AVG_4 = const(0x40)
+MAX30105_SAMPLE_AVG_8 = const(0x60)
+MAX30105_SAMPLE_AVG_16 = const(0x80)
+MAX30105_SAMPLE_AVG_32 = const(0xA0)
+
+MAX30105_ROLLOVER_MASK = const(0xEF)
+MAX30105_ROLLOVER_ENABLE = const(0x10)
+MAX30105_ROLLOVER_DISABLE = const(0x00)
+
+MAX30105_A_FULL_MASK = const(0xF0)
+
+
+MAX30105_SHUTDOWN_MASK = const(0x7F)
+MAX30105_SHUTDOWN = const(0x80)
+MAX30105_WAKEUP = const(0x00)
+MAX30105_RESET_MASK = const(0xBF)
+MAX30105_RESET = const(0x40)
+
+MAX30105_MODE_MASK = const(0xF8)
+MAX30105_MODE_RED_ONLY = const(0x02)
+MAX30105_MODE_RED_IR_ONLY = const(0x03)
+MAX30105_MODE_MULTI_LED = const(0x07)
+
+MAX30105_ADC_RANGE_MASK = const(0x9F)
+MAX30105_ADC_RANGE_2048 = const(0x00)
+MAX30105_ADC_RANGE_4096 = const(0x20)
+MAX30105_ADC_RANGE_8192 = const(0x40)
+MAX30105_ADC_RANGE_16384 = const(0x60)
+
+MAX30105_SAMPLERATE_MASK = const(0xE3)
+MAX30105_SAMPLERATE_50 = const(0x00)
+MAX30105_SAMPLERATE_100 = const(0x04)
+MAX30105_SAMPLERATE_200 = const(0x08)
+MAX30105_SAMPLERATE_400 = const(0x0C)
+MAX30105_SAMPLERATE_800 = const(0x10)
+MAX30105_SAMPLERATE_1000 = const(0x14)
+MAX30105_SAMPLERATE_1600 = const(0x18)
+MAX30105_SAMPLERATE_3200 = const(0x1C)
+
+MAX30105_PULSE_WIDTH_MASK = const(0xFC)
+MAX30105_PULSE_WIDTH_69 = const(0x00)
+MAX30105_PULSE_WIDTH_118 = const(0x01)
+MAX30105_PULSE_WIDTH_215 = const(0x02)
+MAX30105_PULSE_WIDTH_411 = const(0x03)
+
+MAX30105_PULSE_AMP_LOWEST = const(0x02)
+MAX30105_PULSE_AMP_LOW = const(0x1F)
+MAX30105_PULSE_AMP_MEDIUM = const(0x7F)
+MAX30105_PULSE_AMP_HIGH = const(0xFF)
+
+MAX30105_SLOT1_MASK = const(0xF8)
+MAX30105_SLOT2_MASK = const(0x8F)
+MAX30105_SLOT3_MASK = const(0xF8)
+MAX30105_SLOT4_MASK = const(0x8F)
+SLOT_NONE = const(0x00)
+SLOT_RED_LED = const(0x01)
+SLOT_IR_LED = const(0x02)
+SLOT_GREEN_LED = const(0x03)
+SLOT_NONE_PILOT = const(0x04)
+SLOT_RED_PILOT = const(0x05)
+SLOT_IR_PILOT = const(0x06)
+SLOT_GREEN_PILOT = const(0x07)
+
+MAX_30105_EXPECTED_PART_ID = const(0x15)
+
+# 取 FIFO 深度（32）之上最近的 2 的幂，可容纳两次完整突发读取；
+# 必须为 2 的幂，写入位置以掩码回绕
+STORAGE_QUEUE_SIZE = const(64)
+
+# FIFO 深度及指针回绕掩码
+_FIFO_DEPTH = const(32)
+_FIFO_MASK = const(_FIFO_DEPTH - 1)
+
+# 配置参数到寄存器位值的查找表
+_MODE_MAP = {
+    1: MAX30105_MODE_RED_ONLY,
+    2: MAX30105_MODE_RED_IR_ONLY,
+    3: MAX30105_MODE_MULTI_LED,
+}
+
+# 各 LED 模式下 MULTI_LED_CONFIG_1/2 的取值：槽 1 红光，槽 2 红外，槽 3 绿光
+_SLOT_REG_FOR_LEDS = {
+    1: bytes((SLOT_RED_LED, SLOT_NONE)),
+    2: bytes((SLOT_RED_LED | (SLOT_IR_LED << 4), SLOT_NONE)),
+    3: bytes((SLOT_RED_LED | (SLOT_IR_LED << 4), SLOT_GREEN_LED)),
+}
+
+# 中断名称到 (使能寄存器, 位掩码, 使能值) 的查找表
+_INT_MAP = {
+    'a_full': (MAX30105_INT_ENABLE_1, MAX30105_INT_A_FULL_MASK, MAX30105_INT_A_FULL_ENABLE),
+    'data_rdy': (MAX30105_INT_ENABLE_1, MAX30105_INT_DATA_RDY_MASK, MAX30105_INT_DATA_RDY_ENABLE),
+    'alc_ovf': (MAX30105_INT_ENABLE_1, MAX30105_INT_ALC_OVF_MASK, MAX30105_INT_ALC_OVF_ENABLE),
+    'prox_int': (MAX30105_INT_ENABLE_1, MAX30105_INT_PROX_INT_MASK, MAX30105_INT_PROX_INT_ENABLE),
+    'die_temp_rdy': (MAX30105_INT_ENABLE_2, MAX30105_INT_DIE_TEMP_RDY_MASK, MAX30105_INT_DIE_TEMP_RDY_ENABLE),
+}
+
+_ADC_MAP = {
+    2048: MAX30105_ADC_RANGE_2048,
+    4096: MAX30105_ADC_RANGE_4096,
+    8192: MAX30105_ADC_RANGE_8192,
+    16384: MAX30105_ADC_RANGE_16384,
+}
+
+_SR_MAP = {
+    50: MAX30105_SAMPLERATE_50,
+    100: MAX30105_SAMPLERATE_100,
+    200: MAX30105_SAMPLERATE_200,
+    400: MAX30105_SAMPLERATE_400,
+    800: MAX30105_SAMPLERATE_800,
+    1000: MAX30105_SAMPLERATE_1000,
+    1600: MAX30105_SAMPLERATE_1600,
+    3200: MAX30105_SAMPLERATE_3200,
+}
+
+_PW_MAP = {
+    69: MAX30105_PULSE_WIDTH_69,
+    118: MAX30105_PULSE_WIDTH_118,
+    215: MAX30105_PULSE_WIDTH_215,
+    411: MAX30105_PULSE_WIDTH_411,
+}
+
+_AVG_MAP = {
+    1: MAX30105_SAMPLE_AVG_1,
+    2: MAX30105_SAMPLE_AVG_2,
+    4: MAX30105_SAMPLE_AVG_4,
+    8: MAX30105_SAMPLE_AVG_8,
+    16: MAX30105_SAMPLE_AVG_16,
+    32: MAX30105_SAMPLE_AVG_32,
+}
 
 # ======================================== 功能函数 ============================================
 
+@micropython.viper
+def _ingest(src: ptr8, n: int, step: int, off: int, shift: int,
+            dst: ptr32, tail: int, mask: int) -> int:
+    """
+    将 FIFO 原始字节中某一通道的 n 个样本解码后写入环形缓冲的底层数组。
+
+    Args:
+        src (bytearray): FIFO 原始字节。
+        n (int): 样本数。
+        step (int): 每个样本的字节数（active_leds*3）。
+        off (int): 该通道在样本内的字节偏移。
+        shift (int): 解码后右移的位数（脉宽编码）。
+        dst (array): 环形缓冲的 array('i') 存储。
+        tail (int): 当前写入位置。
+        mask (int): 容量减一（容量须为 2 的幂）。
+
+    Returns:
+        int: 写入后的新写入位置。
+
+    =========================================
+    Decode n samples of one channel from raw FIFO bytes straight into the
+    storage array of a ring buffer.
+
+    Args:
+        src (bytearray): Raw FIFO bytes.
+        n (int): Number of samples.
+        step (int): Bytes per sample (active_leds*3).
+        off (int): Byte offset of the channel inside a sample.
+        shift (int): Right shift applied after decoding (pulse width code).
+        dst (array): array('i') storage of the ring buffer.
+        tail (int): Current write position.
+        mask (int): Capacity minus one (capacity must be a power of two).
+
+    Returns:
+        int: New write position.
+    """
+    p = off
+    for i in range(n):
+        dst[tail] = (((src[p] << 16) | (src[p + 1] << 8) | src[p + 2]) & 0x3FFFF) >> shift
+        p += step
+        tail = (tail + 1) & mask
+    return tail
+
 # ======================================== 自定义类 ============================================
 
 class SensorData:
@@ -156,6 +263,9 @@ class SensorData:
             IR (CircularBuffer): 红外通道缓存。
             green (CircularBuffer): 绿光通道缓存。
 
+        Methods:
+            ingest(buf, n, active_leds, shift): 批量写入一次突发读出的 FIFO 样本。
+
         =========================================
         Sensor data container backed by ring buffers.
 
@@ -163,6 +273,9 @@ class SensorData:
             red (CircularBuffer): Red channel buffer.
             IR (CircularBuffer): Infrared channel buffer.
             green (CircularBuffer): Green channel buffer.
+
+        Methods:
+            ingest(buf, n, active_leds, shift): Bulk-store FIFO samples from one burst read.
         """
     def __init__(self):
         """
@@ -176,6 +289,41 @@ class SensorData:
         self.IR = CircularBuffer(STORAGE_QUEUE_SIZE)
         self.green = CircularBuffer(STORAGE_QUEUE_SIZE)
 
+    def ingest(self, buf, n, active_leds, shift):
+        """
+            将一次突发读出的 n 个 FIFO 样本批量写入各通道缓存（满则覆盖最早样本）。
+
+            Args:
+                buf (bytearray): FIFO 原始字节。
+                n (int): 样本数。
+                active_leds (int): 启用的 LED 数量（1~3）。
+                shift (int): 解码后右移的位数（脉宽编码）。
+
+            =========================================
+            Bulk-store n FIFO samples from one burst read into the channel
+            buffers (overwriting the oldest samples when full).
+
+            Args:
+                buf (bytearray): Raw FIFO bytes.
+                n (int): Number of samples.
+                active_leds (int): Number of active LEDs (1..3).
+                shift (int): Right shift applied after decoding (pulse width code).
+        """
+        step = active_leds * 3
+        off = 0
+        for ring in (self.red, self.IR, self.green)[:active_leds]:
+            size = ring.max_size
+            tail = _ingest(buf, n, step, off, shift, ring.buf, ring.tail, size - 1)
+            ring.tail = tail
+            count = ring.count + n
+            if count >= size:
+                # 缓冲已满，最早样本被覆盖，head 与 tail 重合
+                ring.count = size
+                ring.head = tail
+            else:
+                ring.count = count
+            off += 3
+
 class MAX30102(object):
     """
         MAX30102/MAX30105 传感器 I2C 驱动（寄存器配置、FIFO 读取、温度读取等）。
@@ -196,19 +344,24 @@ class MAX30102(object):
             setup_sensor(...): 一次性按常用配置初始化。
             soft_reset(): 软复位。
             shutdown()/wakeup(): 掉电/唤醒。
+            close(): 结束使用并掉电。
             set_led_mode()/set_adc_range()/set_sample_rate()/set_pulse_width(): 基本配置。
             set_pulse_amplitude_*(): LED 电流设置。
             set_fifo_average()/enable_fifo_rollover()/clear_fifo(): FIFO 管理。
             get_write_pointer()/get_read_pointer(): FIFO 指针读。
+            set_interrupt()/enable_*()/disable_*(): 中断使能配置。
             read_temperature(): 读芯片温度。
             read_part_id()/check_part_id()/get_revision_id(): 器件信息。
-            enable_slot()/disable_slots(): 多路 LED 时间槽配置。
+            enable_slot()/disable_slots()/configure_slots(): 多路 LED 时间槽配置。
             check()/safe_check(): 轮询新数据。
+            read_fifo_burst(buf=None): 一次事务读出 FIFO 全部原始样本。
 
         Notes:
             - 本驱动未改动核心业务逻辑，仅补齐注释与文档；
             - "set_pulse_amplitude_it" 方法名沿用原代码（IR 电流），未更名以避免影响业务；
-            - I2C 读写可能抛出 OSError（如 ETIMEDOUT）。
+            - I2C 读写可能抛出 OSError（如 ETIMEDOUT）；
+            - 寄存器读写与改位辅助函数使用 @micropython.native 编译；
+            - 不在析构时访问 I2C（GC 时机不确定），使用完毕请显式调用 close()。
 
         =========================================
         I2C driver for MAX30102/30105 (register/config/FIFO/temperature, etc.).
@@ -229,17 +382,26 @@ class MAX30102(object):
             setup_sensor(...): Initialize once with common configurations.
             soft_reset(): Soft reset.
             shutdown()/wakeup(): Power down/wake up.
+            close(): Finish using the device and power it down.
             set_led_mode()/set_adc_range()/set_sample_rate()/set_pulse_width(): Basic configurations.
             set_pulse_amplitude_*(): LED current setting.
             set_fifo_average()/enable_fifo_rollover()/clear_fifo(): FIFO management.
             get_write_pointer()/get_read_pointer(): FIFO pointer reading.
+            set_interrupt()/enable_*()/disable_*(): Interrupt enable configuration.
             read_temperature(): Read chip temperature.
-            read_part_id()/
+            read_part_id()/check_part_id()/get_revision_id(): Device information.
+            enable_slot()/disable_slots()/configure_slots(): Multi-LED time-slot configuration.
+            check()/safe_check(): Poll for new data.
+            read_fifo_burst(buf=None): Read all raw FIFO samples in one transaction.
 
         Notes:
             - Core logic unchanged; only documentation/comments were added;
             - The method name "set_pulse_amplitude_it" is kept as-is (IR current);
-            - I2C ops may raise OSError (e.g., ETIMEDOUT).
+            - I2C ops may raise OSError (e.g., ETIMEDOUT);
+            - Register read/write and bitmask helpers are compiled with
+              @micropython.native;
+            - No I2C traffic happens in a finalizer (GC timing is
+              non-deterministic); call close() explicitly when done.
         """
     def __init__(self,i2c: SoftI2C,i2c_hex_address=MAX3010X_I2C_ADDRESS,):
         """
@@ -267,6 +429,10 @@ class MAX30102(object):
 
         self.i2c_address = i2c_hex_address
         self._i2c = i2c
+        # 缓存 I2C 绑定方法，调用时省去一次属性查找
+        self._i2c_w = i2c.writeto_mem
+        self._i2c_r = i2c.readfrom_mem
+        self._i2c_ri = i2c.readfrom_mem_into
         self._active_leds = None
         self._pulse_width = None
         self._multi_led_read_mode = None
@@ -276,6 +442,17 @@ class MAX30102(object):
         self._acq_frequency = None
         self._acq_frequency_inv = None
         self.sense = SensorData()
+        # 单字节寄存器读取复用的缓冲区，避免每次读取分配新对象
+        self._r1 = bytearray(1)
+        self._mv1 = memoryview(self._r1)
+        # 单字节寄存器写入复用的缓冲区
+        self._w1 = bytearray(1)
+        # 双字节读取（温度整数 + 小数部分）复用的缓冲区
+        self._r2 = bytearray(2)
+        # FIFO 写指针/溢出计数/读指针一次读取的缓冲区
+        self._r3 = bytearray(3)
+        # FIFO 突发读取缓冲区：32 个样本 x 最多 3 路 LED x 3 字节
+        self._fifo_buf = bytearray(32 * 9)
 
     def setup_sensor(self, led_mode=2, adc_range=16384, sample_rate=400,
                      led_power=MAX30105_PULSE_AMP_MEDIUM, sample_avg=8,
@@ -310,26 +487,59 @@ class MAX30102(object):
                TypeError: If any argument is not int.
                ValueError: If any argument is out of allowed range.
         """
-        
+        try:
+            mode = _MODE_MAP[led_mode]
+        except KeyError:
+            raise ValueError('Wrong LED mode:{0}!'.format(led_mode))
+        try:
+            adc = _ADC_MAP[adc_range]
+        except KeyError:
+            raise ValueError('Wrong ADC range:{0}!'.format(adc_range))
+        try:
+            sr = _SR_MAP[sample_rate]
+        except KeyError:
+            raise ValueError('Wrong sample rate:{0}!'.format(sample_rate))
+        try:
+            pw = _PW_MAP[pulse_width]
+        except KeyError:
+            raise ValueError('Wrong pulse width:{0}!'.format(pulse_width))
+        try:
+            ns = _AVG_MAP[sample_avg]
+        except KeyError:
+            raise ValueError(
+                'Wrong number of samples:{0}!'.format(sample_avg))
+
+        # 复位后各寄存器为已知默认值，无需逐个读-改-写：
+        # FIFO_CONFIG(0x08) ~ LED3_PULSE_AMP(0x0E) 地址连续，一次写入
         self.soft_reset()
-        self.set_fifo_average(sample_avg)
-        self.enable_fifo_rollover()
-        self.set_led_mode(led_mode)
-        self.set_adc_range(adc_range)
-        self.set_sample_rate(sample_rate)
-        self.set_pulse_width(pulse_width)
-        self.set_pulse_amplitude_red(led_power)
-        self.set_pulse_amplitude_it(led_power)
-        self.set_pulse_amplitude_green(led_power)
-        self.set_pulse_amplitude_proximity(led_power)
+        self._i2c_w(self.i2c_address, MAX30105_FIFO_CONFIG, bytes((
+            ns | MAX30105_ROLLOVER_ENABLE,
+            mode,
+            adc | sr | pw,
+            0,
+            led_power,
+            led_power,
+            led_power,
+        )))
+        # LED_PROX_AMP(0x10) 与 MULTI_LED_CONFIG_1/2(0x11, 0x12) 一次写入
+        self._i2c_w(self.i2c_address, MAX30105_LED_PROX_AMP,
+                    bytes((led_power,)) + _SLOT_REG_FOR_LEDS[led_mode])
         self.clear_fifo()
 
-    def __del__(self):
+        self._active_leds = led_mode
+        self._multi_led_read_mode = led_mode * 3
+        self._pulse_width = pw
+        self._sample_rate = sample_rate
+        self._sample_avg = sample_avg
+        self.update_acquisition_frequency()
+
+    def close(self):
         """
-            析构：设备转入低功耗。
+            结束使用：设备转入低功耗（替代析构函数，需显式调用）。
 
             =========================================
-            Destructor: put device into low power mode.
+            Finish using the device: put it into low power mode (replaces the
+            finalizer; must be called explicitly).
         """
         self.shutdown()
 
@@ -365,7 +575,33 @@ class MAX30102(object):
         rev_id = self.i2c_read_register(MAX30105_INT_STAT_2)
         return rev_id
 
-    
+    def set_interrupt(self, name, enable):
+        """
+        按名称使能或关闭中断。
+
+        Args:
+            name (str): 'a_full'/'data_rdy'/'alc_ovf'/'prox_int'/'die_temp_rdy'。
+            enable (bool): True 使能，False 关闭。
+
+        Raises:
+            ValueError: 中断名称不支持。
+
+        =========================================
+        Enable or disable an interrupt by name.
+
+        Args:
+            name (str): 'a_full'/'data_rdy'/'alc_ovf'/'prox_int'/'die_temp_rdy'.
+            enable (bool): True to enable, False to disable.
+
+        Raises:
+            ValueError: If the interrupt name is not supported.
+        """
+        try:
+            reg, mask, on = _INT_MAP[name]
+        except KeyError:
+            raise ValueError('Wrong interrupt:{0}!'.format(name))
+        self.bitmask(reg, mask, on if enable else 0)
+
     def enable_a_full(self):
         """
         使能 FIFO 接近满中断。
@@ -373,7 +609,7 @@ class MAX30102(object):
         =========================================
         Enable the "almost full" FIFO interrupt.
         """
-        self.bitmask(MAX30105_INT_ENABLE_1, MAX30105_INT_A_FULL_MASK, MAX30105_INT_A_FULL_ENABLE)
+        self.set_interrupt('a_full', True)
 
     def disable_a_full(self):
         """
@@ -382,7 +618,7 @@ class MAX30102(object):
         =========================================
         Disable the "almost full" FIFO interrupt.
         """
-        self.bitmask(MAX30105_INT_ENABLE_1, MAX30105_INT_A_FULL_MASK, MAX30105_INT_A_FULL_DISABLE)
+        self.set_interrupt('a_full', False)
 
     def enable_data_rdy(self):
         """
@@ -391,7 +627,7 @@ class MAX30102(object):
         =========================================
         Enable the FIFO data-ready interrupt.
         """
-        self.bitmask(MAX30105_INT_ENABLE_1, MAX30105_INT_DATA_RDY_MASK, MAX30105_INT_DATA_RDY_ENABLE)
+        self.set_interrupt('data_rdy', True)
 
     def disable_data_rdy(self):
         """
@@ -400,7 +636,7 @@ class MAX30102(object):
         =========================================
         Disable the FIFO data-ready interrupt.
         """
-        self.bitmask(MAX30105_INT_ENABLE_1, MAX30105_INT_DATA_RDY_MASK, MAX30105_INT_DATA_RDY_DISABLE)
+        self.set_interrupt('data_rdy', False)
 
     def enable_alc_ovf(self):
         """
@@ -409,7 +645,7 @@ class MAX30102(object):
         =========================================
         Enable ambient light overflow interrupt.
         """
-        self.bitmask(MAX30105_INT_ENABLE_1, MAX30105_INT_ALC_OVF_MASK, MAX30105_INT_ALC_OVF_ENABLE)
+        self.set_interrupt('alc_ovf', True)
 
     def disable_alc_ovf(self):
         """
@@ -418,7 +654,7 @@ class MAX30102(object):
         =========================================
         Disable ambient light overflow interrupt.
         """
-        self.bitmask(MAX30105_INT_ENABLE_1, MAX30105_INT_ALC_OVF_MASK, MAX30105_INT_ALC_OVF_DISABLE)
+        self.set_interrupt('alc_ovf', False)
 
     def enable_prox_int(self):
         """
@@ -427,7 +663,7 @@ class MAX30102(object):
         =========================================
         Enable proximity interrupt.
         """
-        self.bitmask(MAX30105_INT_ENABLE_1, MAX30105_INT_PROX_INT_MASK, MAX30105_INT_PROX_INT_ENABLE)
+        self.set_interrupt('prox_int', True)
 
     def disable_prox_int(self):
         """
@@ -436,7 +672,7 @@ class MAX30102(object):
         =========================================
         Disable proximity interrupt.
         """
-        self.bitmask(MAX30105_INT_ENABLE_1, MAX30105_INT_PROX_INT_MASK, MAX30105_INT_PROX_INT_DISABLE)
+        self.set_interrupt('prox_int', False)
 
     def enable_die_temp_rdy(self):
         """
@@ -445,7 +681,7 @@ class MAX30102(object):
         =========================================
         Enable die-temperature ready interrupt.
         """
-        self.bitmask(MAX30105_INT_ENABLE_2, MAX30105_INT_DIE_TEMP_RDY_MASK, MAX30105_INT_DIE_TEMP_RDY_ENABLE)
+        self.set_interrupt('die_temp_rdy', True)
 
     def disable_die_temp_rdy(self):
         """
@@ -454,20 +690,30 @@ class MAX30102(object):
         =========================================
         Disable die-temperature ready interrupt.
         """
-        self.bitmask(MAX30105_INT_ENABLE_2, MAX30105_INT_DIE_TEMP_RDY_MASK, MAX30105_INT_DIE_TEMP_RDY_DISABLE)
+        self.set_interrupt('die_temp_rdy', False)
 
     def soft_reset(self):
         """
         软复位（复位后等待 RESET 位自动清零）。
 
+        Raises:
+            OSError: RESET 位在 100 ms 内未清零。
+
         =========================================
         Soft-reset the device and wait until the RESET bit clears.
+
+        Raises:
+            OSError: If the RESET bit does not clear within 100 ms.
         """
         self.set_bitmask(MAX30105_MODE_CONFIG, MAX30105_RESET_MASK, MAX30105_RESET)
-        curr_status = -1
-        while not ((curr_status & MAX30105_RESET) == 0):
-            sleep_ms(10)
-            curr_status = ord(self.i2c_read_register(MAX30105_MODE_CONFIG))
+        deadline = ticks_add(ticks_ms(), 100)
+        delay = 1
+        # 轮询间隔从 1 ms 起指数退避至 5 ms，超过截止时间则认为总线或器件异常
+        while self._read_u8(MAX30105_MODE_CONFIG) & MAX30105_RESET:
+            if ticks_diff(deadline, ticks_ms()) <= 0:
+                raise OSError('reset timeout')
+            sleep_ms(delay)
+            delay = min(delay * 2, 5)
 
     def shutdown(self):
         """
@@ -506,20 +752,14 @@ class MAX30102(object):
         Raises:
             ValueError: If mode not supported.
         """
-        if LED_mode == 1:
-            self.set_bitmask(MAX30105_MODE_CONFIG, MAX30105_MODE_MASK, MAX30105_MODE_RED_ONLY)
-        elif LED_mode == 2:
-            self.set_bitmask(MAX30105_MODE_CONFIG, MAX30105_MODE_MASK, MAX30105_MODE_RED_IR_ONLY)
-        elif LED_mode == 3:
-            self.set_bitmask(MAX30105_MODE_CONFIG, MAX30105_MODE_MASK, MAX30105_MODE_MULTI_LED)
-        else:
+        try:
+            mode = _MODE_MAP[LED_mode]
+        except KeyError:
             raise ValueError('Wrong LED mode:{0}!'.format(LED_mode))
-
-        self.enable_slot(1, SLOT_RED_LED)
-        if LED_mode > 1:
-            self.enable_slot(2, SLOT_IR_LED)
-        if LED_mode > 2:
-            self.enable_slot(3, SLOT_GREEN_LED)
+        self.set_bitmask(MAX30105_MODE_CONFIG, MAX30105_MODE_MASK, mode)
+        # 两个时间槽寄存器地址连续，按查表结果一次写入
+        self._i2c_w(self.i2c_address, MAX30105_MULTI_LED_CONFIG_1,
+                    _SLOT_REG_FOR_LEDS[LED_mode])
 
         self._active_leds = LED_mode
         self._multi_led_read_mode = LED_mode * 3
@@ -544,15 +784,9 @@ class MAX30102(object):
             ValueError: If range not supported.
         """
 
-        if ADC_range == 2048:
-            r = MAX30105_ADC_RANGE_2048
-        elif ADC_range == 4096:
-            r = MAX30105_ADC_RANGE_4096
-        elif ADC_range == 8192:
-            r = MAX30105_ADC_RANGE_8192
-        elif ADC_range == 16384:
-            r = MAX30105_ADC_RANGE_16384
-        else:
+        try:
+            r = _ADC_MAP[ADC_range]
+        except KeyError:
             raise ValueError('Wrong ADC range:{0}!'.format(ADC_range))
 
         self.set_bitmask(MAX30105_PARTICLE_CONFIG, MAX30105_ADC_RANGE_MASK, r)
@@ -577,23 +811,9 @@ class MAX30102(object):
             ValueError: If rate not supported.
         """
 
-        if sample_rate == 50:
-            sr = MAX30105_SAMPLERATE_50
-        elif sample_rate == 100:
-            sr = MAX30105_SAMPLERATE_100
-        elif sample_rate == 200:
-            sr = MAX30105_SAMPLERATE_200
-        elif sample_rate == 400:
-            sr = MAX30105_SAMPLERATE_400
-        elif sample_rate == 800:
-            sr = MAX30105_SAMPLERATE_800
-        elif sample_rate == 1000:
-            sr = MAX30105_SAMPLERATE_1000
-        elif sample_rate == 1600:
-            sr = MAX30105_SAMPLERATE_1600
-        elif sample_rate == 3200:
-            sr = MAX30105_SAMPLERATE_3200
-        else:
+        try:
+            sr = _SR_MAP[sample_rate]
+        except KeyError:
             raise ValueError('Wrong sample rate:{0}!'.format(sample_rate))
 
         self.set_bitmask(MAX30105_PARTICLE_CONFIG, MAX30105_SAMPLERATE_MASK, sr)
@@ -619,15 +839,9 @@ class MAX30102(object):
         Raises:
             ValueError: If width not supported.
         """
-        if pulse_width == 69:
-            pw = MAX30105_PULSE_WIDTH_69
-        elif pulse_width == 118:
-            pw = MAX30105_PULSE_WIDTH_118
-        elif pulse_width == 215:
-            pw = MAX30105_PULSE_WIDTH_215
-        elif pulse_width == 411:
-            pw = MAX30105_PULSE_WIDTH_411
-        else:
+        try:
+            pw = _PW_MAP[pulse_width]
+        except KeyError:
             raise ValueError('Wrong pulse width:{0}!'.format(pulse_width))
         self.set_bitmask(MAX30105_PARTICLE_CONFIG, MAX30105_PULSE_WIDTH_MASK, pw)
         self._pulse_width = pw
@@ -653,12 +867,9 @@ class MAX30102(object):
                 TypeError: If amplitude is not an int.
                 ValueError: If amplitude is not in the range 0x02–0xFF.
         """
-        if self._active_leds > 0:
-            self.set_pulse_amplitude_red(amplitude)
-        if self._active_leds > 1:
-            self.set_pulse_amplitude_it(amplitude)
-        if self._active_leds > 2:
-            self.set_pulse_amplitude_green(amplitude)
+        # LED1~LED3 电流寄存器（0x0C~0x0E）地址连续，按启用数量一次写入
+        self._i2c_w(self.i2c_address, MAX30105_LED1_PULSE_AMP,
+                    bytes((amplitude,)) * self._active_leds)
 
     def set_pulse_amplitude_red(self, amplitude):
         """
@@ -756,19 +967,9 @@ class MAX30102(object):
                ValueError: If not supported.
        """
 
-        if number_of_samples == 1:
-            ns = MAX30105_SAMPLE_AVG_1
-        elif number_of_samples == 2:
-            ns = MAX30105_SAMPLE_AVG_2
-        elif number_of_samples == 4:
-            ns = MAX30105_SAMPLE_AVG_4
-        elif number_of_samples == 8:
-            ns = MAX30105_SAMPLE_AVG_8
-        elif number_of_samples == 16:
-            ns = MAX30105_SAMPLE_AVG_16
-        elif number_of_samples == 32:
-            ns = MAX30105_SAMPLE_AVG_32
-        else:
+        try:
+            ns = _AVG_MAP[number_of_samples]
+        except KeyError:
             raise ValueError(
                 'Wrong number of samples:{0}!'.format(number_of_samples))
 
@@ -783,13 +984,15 @@ class MAX30102(object):
         =========================================
         Update effective acquisition frequency and suggested read interval.
         """
-        if None in [self._sample_rate, self._sample_avg]:
+        sample_rate = self._sample_rate
+        sample_avg = self._sample_avg
+        if sample_rate is None or sample_avg is None:
             return
-        else:
-            self._acq_frequency = self._sample_rate / self._sample_avg
-            from math import ceil
-            self._acq_frequency_inv = int(ceil(1000 / self._acq_frequency))
+        self._acq_frequency = sample_rate / sample_avg
+        # ceil(1000 / (sample_rate / sample_avg)) 的整数形式
+        self._acq_frequency_inv = (1000 * sample_avg + sample_rate - 1) // sample_rate
 
+    @micropython.native
     def get_acquisition_frequency(self):
         """
            获取有效采集频率（SPS）。
@@ -889,27 +1092,35 @@ class MAX30102(object):
             Returns:
                 float: 摄氏温度。
 
+            Raises:
+                OSError: 转换在 50 ms 内未完成。
+
             =========================================
             Read die temperature in Celsius.
 
             Returns:
                 float: Temperature in °C.
+
+            Raises:
+                OSError: If the conversion does not finish within 50 ms.
         """
 
         self.i2c_set_register(MAX30105_DIE_TEMP_CONFIG, 0x01)
-        reading = ord(self.i2c_read_register(MAX30105_INT_STAT_2))
-        sleep_ms(100)
-        while (reading & MAX30105_INT_DIE_TEMP_RDY_ENABLE) > 0:
-            reading = ord(self.i2c_read_register(MAX30105_INT_STAT_2))
-            sleep_ms(1)
-
-        
-        tempInt = ord(self.i2c_read_register(MAX30105_DIE_TEMP_INT))
-        
-        tempFrac = ord(self.i2c_read_register(MAX30105_DIE_TEMP_FRAC))
-
-        
-        return float(tempInt) + (float(tempFrac) * 0.0625)
+        # 转换约 29 ms，完成后 TEMP_EN 位自动清零；每 5 ms 轮询一次，最多等待 50 ms
+        deadline = ticks_add(ticks_ms(), 50)
+        while self._read_u8(MAX30105_DIE_TEMP_CONFIG) & 0x01:
+            if ticks_diff(deadline, ticks_ms()) <= 0:
+                raise OSError('temperature timeout')
+            sleep_ms(5)
+
+        # TINT(0x1F) 与 TFRAC(0x20) 地址连续，一次读出
+        buf = self._r2
+        self._i2c_ri(self.i2c_address, MAX30105_DIE_TEMP_INT, buf)
+        temp_int = buf[0]
+        # TINT 为二进制补码
+        if temp_int > 127:
+            temp_int -= 256
+        return temp_int + (buf[1] & 0x0F) * 0.0625
 
     def set_prox_int_tresh(self, val):
         """
@@ -956,7 +1167,7 @@ class MAX30102(object):
         Returns:
             bool: True if matched.
         """
-        part_id = ord(self.read_part_id())
+        part_id = self._read_u8(MAX30105_PART_ID)
         return part_id == MAX_30105_EXPECTED_PART_ID
 
     def get_revision_id(self):
@@ -972,8 +1183,7 @@ class MAX30102(object):
         Returns:
             int: Revision number.
         """
-        rev_id = self.i2c_read_register(MAX30105_REVISION_ID)
-        return ord(rev_id)
+        return self._read_u8(MAX30105_REVISION_ID)
 
     def enable_slot(self, slot_number, device):
         """
@@ -1016,19 +1226,43 @@ class MAX30102(object):
         =========================================
         Clear all time-slot assignments.
         """
-        self.i2c_set_register(MAX30105_MULTI_LED_CONFIG_1, 0)
-        self.i2c_set_register(MAX30105_MULTI_LED_CONFIG_2, 0)
+        self.configure_slots(SLOT_NONE, SLOT_NONE, SLOT_NONE, SLOT_NONE)
 
-    def i2c_read_register(self, REGISTER, n_bytes=1):
+    def configure_slots(self, slot1, slot2, slot3, slot4):
+        """
+        一次写入全部四个时间槽（MULTI_LED_CONFIG_1/2 地址连续，无需读-改-写）。
+
+        Args:
+            slot1 (int): 槽 1 绑定，SLOT_* 常量之一。
+            slot2 (int): 槽 2 绑定。
+            slot3 (int): 槽 3 绑定。
+            slot4 (int): 槽 4 绑定。
+
+        =========================================
+        Write all four time slots at once (MULTI_LED_CONFIG_1/2 are adjacent,
+        so no read-modify-write is needed).
+
+        Args:
+            slot1 (int): Slot 1 assignment, one of the SLOT_* constants.
+            slot2 (int): Slot 2 assignment.
+            slot3 (int): Slot 3 assignment.
+            slot4 (int): Slot 4 assignment.
+        """
+        self._i2c_w(self.i2c_address, MAX30105_MULTI_LED_CONFIG_1,
+                    bytes(((slot2 << 4) | slot1, (slot4 << 4) | slot3)))
+
+    @micropython.native
+    def i2c_read_register(self, REGISTER, n_bytes=1, into=None):
         """
         读寄存器。
 
         Args:
             REGISTER (int): 寄存器地址。
             n_bytes (int): 读取字节数（默认 1）。
+            into (bytearray|memoryview|None): 若给出，则直接读入该缓冲区（长度即读取字节数），不分配新对象。
 
         Returns:
-            bytes: 读取到的字节序列。
+            bytes|bytearray|memoryview: 读取到的字节序列；给出 into 时返回 into。
 
         =========================================
         Read register bytes.
@@ -1036,15 +1270,42 @@ class MAX30102(object):
         Args:
             REGISTER (int): Register address.
             n_bytes (int): Number of bytes to read (default 1).
+            into (bytearray|memoryview|None): When given, read straight into
+                this buffer (its length is the byte count) without allocating.
+
+        Returns:
+            bytes|bytearray|memoryview: Raw bytes read; into itself when given.
+        """
+        if into is not None:
+            self._i2c_ri(self.i2c_address, REGISTER, into)
+            return into
+        # 寄存器地址写入与读取合并为一次重复起始事务
+        return self._i2c_r(self.i2c_address, REGISTER, n_bytes)
+
+    @micropython.native
+    def _read_u8(self, REGISTER):
+        """
+        读取单字节寄存器到预分配缓冲区并返回整数值。
+
+        Args:
+            REGISTER (int): 寄存器地址。
+
+        Returns:
+            int: 寄存器值（0~255）。
+
+        =========================================
+        Read a single-byte register into the preallocated buffer.
+
+        Args:
+            REGISTER (int): Register address.
 
         Returns:
-            bytes: Raw bytes read.
+            int: Register value (0..255).
         """
-        self._i2c.writeto(self.i2c_address, bytearray([REGISTER]))
-        return self._i2c.readfrom(self.i2c_address, n_bytes)
-        self._i2c.writeto(self.i2c_address, bytearray([REGISTER]))
-        return self._i2c.readfrom(self.i2c_address, n_bytes)
+        self._i2c_ri(self.i2c_address, REGISTER, self._mv1)
+        return self._r1[0]
 
+    @micropython.native
     def i2c_set_register(self, REGISTER, VALUE):
         """
         写寄存器一个字节。
@@ -1060,10 +1321,12 @@ class MAX30102(object):
             REGISTER (int): Register address.
             VALUE (int): 1-byte value to write.
         """
-        self._i2c.writeto(self.i2c_address, bytearray([REGISTER, VALUE]))
-        return
+        w1 = self._w1
+        w1[0] = VALUE
+        self._i2c_w(self.i2c_address, REGISTER, w1)
 
     
+    @micropython.native
     def set_bitmask(self, REGISTER, MASK, NEW_VALUES):
         """
         读取-掩码-合并-写回（便捷改位）。
@@ -1081,38 +1344,23 @@ class MAX30102(object):
             MASK (int): Bit mask.
             NEW_VALUES (int): New value (already aligned).
         """
-        newCONTENTS = (ord(self.i2c_read_register(REGISTER)) & MASK) | NEW_VALUES
-        self.i2c_set_register(REGISTER, newCONTENTS)
-        return
-
-    
-    def bitmask(self, reg, slotMask, thing):
-        """
-        读取寄存器、按掩码保留位后与新值合并写回。
-
-        Args:
-            reg (int): 寄存器地址。
-            slotMask (int): 位掩码。
-            thing (int): 合并的新值。
-
-        =========================================
-        Read register, apply mask, OR with new value, then write back.
+        # 读入与写回共用同一单字节缓冲区，整个读-改-写不分配对象
+        address = self.i2c_address
+        r1 = self._r1
+        self._i2c_ri(address, REGISTER, self._mv1)
+        r1[0] = (r1[0] & MASK) | NEW_VALUES
+        self._i2c_w(address, REGISTER, r1)
 
-        Args:
-            reg (int): Register address.
-            slotMask (int): Bit mask.
-            thing (int): New value.
-        """
-        originalContents = ord(self.i2c_read_register(reg))
-        originalContents = originalContents & slotMask
-        self.i2c_set_register(reg, originalContents | thing)
+    # 与 set_bitmask 行为相同，保留该名称以兼容原接口
+    bitmask = set_bitmask
 
-    def fifo_bytes_to_int(self, fifo_bytes):
+    def fifo_bytes_to_int(self, fifo_bytes, offset=0):
         """
         将 FIFO 中的 3 字节样本解码为整数，并按当前脉宽位宽右移。
 
         Args:
-            fifo_bytes (bytes): 3 字节原始数据。
+            fifo_bytes (bytes|bytearray|memoryview): 原始数据。
+            offset (int): 样本在缓冲区中的起始偏移（默认 0），无需先切片。
 
         Returns:
             int: 解码后的样本值。
@@ -1122,13 +1370,16 @@ class MAX30102(object):
         configured pulse width.
 
         Args:
-            fifo_bytes (bytes): 3 raw bytes.
+            fifo_bytes (bytes|bytearray|memoryview): Raw data.
+            offset (int): Start offset of the sample in the buffer (default 0),
+                so no slice is needed.
 
         Returns:
             int: Decoded sample value.
         """
-        value = unpack(">i", b'\x00' + fifo_bytes)
-        return (value[0] & 0x3FFFF) >> self._pulse_width
+        # 3 字节大端样本直接按位拼接，不经过 struct
+        value = (fifo_bytes[offset] << 16) | (fifo_bytes[offset + 1] << 8) | fifo_bytes[offset + 2]
+        return (value & 0x3FFFF) >> self._pulse_width
 
     
     def available(self):
@@ -1289,60 +1540,77 @@ class MAX30102(object):
             return True
 
     
-    def check(self):
+    def read_fifo_burst(self, buf=None):
         """
-        轮询读取 FIFO 新数据并写入环形缓冲。
+        以一次 I2C 事务读出 FIFO 中的全部样本原始字节。
+
+        Args:
+            buf (bytearray|None): 接收缓冲区，长度至少为 32 * 每样本字节数（active_leds*3）；
+                为 None 时使用驱动内部预分配的缓冲区。
 
         Returns:
-            bool: 若有新数据返回 True，否则 False。
+            int: 读出的样本数；每个样本依次为各 LED 通道的 3 字节大端原始值。
 
         =========================================
-        Poll the sensor for new FIFO data and push into ring buffers.
-
-        Returns:
-            bool: True if new data found, else False.
-        """
-        
-        read_pointer = ord(self.get_read_pointer())
-        write_pointer = ord(self.get_write_pointer())
+        Read all pending FIFO samples as raw bytes in a single I2C transaction.
 
-        
-        if read_pointer != write_pointer:
-            
-            number_of_samples = write_pointer - read_pointer
+        Args:
+            buf (bytearray|None): Destination buffer, at least 32 * bytes-per-sample
+                (active_leds*3) long; the driver's preallocated buffer is used
+                when None.
 
-            
-            if number_of_samples < 0:
-                number_of_samples += 32
+        Returns:
+            int: Number of samples read; each sample holds one 3-byte
+                big-endian raw value per active LED channel.
+        """
+        if buf is None:
+            buf = self._fifo_buf
+        # 写指针、溢出计数、读指针（0x04~0x06）地址连续，一次读出
+        ptrs = self._r3
+        self._i2c_ri(self.i2c_address, MAX30105_FIFO_WRITE_PTR, ptrs)
+        if ptrs[1]:
+            # 发生溢出时 FIFO 已满，读写指针重合
+            number_of_samples = _FIFO_DEPTH
+        else:
+            # 指针差按 FIFO 深度回绕
+            number_of_samples = (ptrs[0] - ptrs[2]) & _FIFO_MASK
+        if number_of_samples:
+            n_bytes = number_of_samples * self._multi_led_read_mode
+            self._i2c_ri(self.i2c_address, MAX30105_FIFO_DATA,
+                         memoryview(buf)[:n_bytes])
+        return number_of_samples
 
-            for i in range(number_of_samples):
-                
-                fifo_bytes = self.i2c_read_register(MAX30105_FIFO_DATA,
-                                                    self._multi_led_read_mode)
+    @micropython.native
+    def check(self):
+        """
+        轮询读取 FIFO 新数据并写入环形缓冲。
 
-                
-                
-                if self._active_leds > 0:
-                    self.sense.red.append(
-                        self.fifo_bytes_to_int(fifo_bytes[0:3])
-                    )
+        Returns:
+            bool: 若有新数据返回 True，否则 False。
 
-                if self._active_leds > 1:
-                    self.sense.IR.append(
-                        self.fifo_bytes_to_int(fifo_bytes[3:6])
-                    )
+        Notes:
+            - FIFO 中的全部样本通过 read_fifo_burst 一次读出，再由 SensorData.ingest 批量解码写入各通道缓存。
 
-                if self._active_leds > 2:
-                    self.sense.green.append(
-                        self.fifo_bytes_to_int(fifo_bytes[6:9])
-                    )
+        =========================================
+        Poll the sensor for new FIFO data and push into ring buffers.
 
-                return True
+        Returns:
+            bool: True if new data found, else False.
 
-        else:
+        Notes:
+            - All pending samples are fetched with one read_fifo_burst call and
+              bulk-decoded into the channel buffers by SensorData.ingest.
+        """
+        number_of_samples = self.read_fifo_burst()
+        if not number_of_samples:
             return False
 
+        self.sense.ingest(self._fifo_buf, number_of_samples,
+                          self._active_leds, self._pulse_width)
+        return True
+
     
+    @micropython.native
     def safe_check(self, max_time_to_check):
         """
         在给定超时时间（ms）内循环调用 check() 直到有新数据或超时。
@@ -1362,15 +1630,20 @@ class MAX30102(object):
             bool: True if new data found; False on timeout.
 
         """
-        mark_time = ticks_ms()
+        # 循环内使用局部引用，避免每次迭代查找属性与全局名
+        check = self.check
+        now = ticks_ms
+        diff = ticks_diff
+        sleep = sleep_ms
+        mark_time = now()
         while True:
-            if ticks_diff(ticks_ms(), mark_time) > max_time_to_check:
+            if diff(now(), mark_time) > max_time_to_check:
                 
                 return False
-            if self.check():
+            if check():
                 
                 return True
-            sleep_ms(1)
+            sleep(1)
 
 # ======================================== 初始化配置 ==========================================
 
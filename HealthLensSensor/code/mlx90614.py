@@ -13,8 +13,6 @@ __platform__ = "MicroPython v1.23"
 
 # ======================================== 导入相关模块 =========================================
 
-#导入模块用于数据打包和解包
-import ustruct
 from machine import I2C, Pin
 
 # ======================================== 全局变量 =============================================
@@ -88,9 +86,10 @@ class SensorBase:
         Notes:
             Internal use only.
         """
-        data = self.i2c.readfrom_mem(self.address, register, 2)
-        # 小端字节序，H表示16位无符号整数，返回一个元组，取第0个数据表示取元组的数据
-        return ustruct.unpack('<H', data)[0]
+        # 读入预分配的 2 字节缓冲区，小端字节序直接拼接为 16 位无符号整数
+        buf = self._tbuf
+        self.i2c.readfrom_mem_into(self.address, register, buf)
+        return (buf[1] << 8) | buf[0]
 
     def _read_temp(self, register: int) -> float:
         """
@@ -285,6 +284,7 @@ class MLX90614(SensorBase):
     Methods:
         init(i2c, address: int = None) -> None: 初始化传感器。
         read() -> dict: 一次性读取 ambient、object、object2 数据。
+        read_all() -> tuple: 连续读取 (ambient, object, object2)。
         get() -> dict: read 的别名方法。
 
     Notes:
@@ -302,6 +302,7 @@ class MLX90614(SensorBase):
     Methods:
         init(i2c, address: int = None) -> None: Initialize sensor.
         read() -> dict: Read ambient, object, object2 data at once.
+        read_all() -> tuple: Read (ambient, object, object2) back to back.
         get() -> dict: Alias for read().
 
     Notes:
@@ -353,8 +354,9 @@ class MLX90614(SensorBase):
             raise ValueError(f"Invalid MLX90615 I2C address: 0x{address:x}")
         self.i2c = i2c
         self.address = address
-        _config1 = i2c.readfrom_mem(address, 0x25, 2)
-        _dz = ustruct.unpack('<H', _config1)[0] & (1 << 6)
+        # 16 位寄存器读取复用的缓冲区
+        self._tbuf = bytearray(2)
+        _dz = self._read16(0x25) & (1 << 6)
         self.dual_zone = True if _dz else False
 
     def read(self) -> dict:
@@ -377,12 +379,44 @@ class MLX90614(SensorBase):
         Notes:
             object2 is None if not dual-zone.
         """
+        ambient, obj, obj2 = self.read_all()
         return {
-            "ambient": self.read_ambient(),
-            "object": self.read_object(),
-            "object2": self.read_object2() if self.dual_zone else None,
+            "ambient": ambient,
+            "object": obj,
+            "object2": obj2,
         }
 
+    def read_all(self) -> tuple:
+        """
+        连续读取环境温度、物体温度及第二路物体温度（℃），返回元组。
+
+        Returns:
+            tuple: (ambient, object, object2)，非双温区时 object2 为 None。
+
+        Notes:
+            MLX90614 为 SMBus 读字协议，每个 RAM 寄存器需单独一次事务（不支持地址自增），
+            因此这里仍为每路一次 readfrom_mem，但省去了逐个方法调用与中间换算函数。
+
+        ==========================================
+
+        Read ambient, object and second object temperatures (℃) back to back,
+        returned as a tuple.
+
+        Returns:
+            tuple: (ambient, object, object2); object2 is None if not dual-zone.
+
+        Notes:
+            The MLX90614 uses SMBus read-word, so each RAM register needs its
+            own transaction (no address auto-increment); this still issues one
+            readfrom_mem per channel but skips the per-method call chain and
+            the intermediate conversion helper.
+        """
+        read16 = self._read16
+        ambient = read16(self._REGISTER_TA) * 0.02 - 273.15
+        obj = read16(self._REGISTER_TOBJ1) * 0.02 - 273.15
+        obj2 = read16(self._REGISTER_TOBJ2) * 0.02 - 273.15 if self.dual_zone else None
+        return ambient, obj, obj2
+
     def get(self) -> dict:
         """
         读取传感器数据的别名方法，功能与 read() 完全相同。
@@ -480,6 +514,8 @@ class MLX90615(SensorBase):
             raise ValueError(f"Invalid MLX90615 I2C address: 0x{address:x}")
         self.i2c = i2c
         self.address = address
+        # 16 位寄存器读取复用的缓冲区
+        self._tbuf = bytearray(2)
         self.dual_zone = False
 
 # ======================================== 初始化配置 ===========================================
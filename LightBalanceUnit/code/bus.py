@@ -0,0 +1,22 @@
+# Python env   : MicroPython v1.23.0
+# -*- coding: utf-8 -*-
+# @Time    : 2025/9/18 上午10:20
+# @Author  : hogeiha
+# @File    : bus.py
+# @Description : I2C总线与PCF8575实例的单例模块，各子模块统一从此导入，避免重复初始化和扫描总线
+
+# ======================================== 导入相关模块 =========================================
+
+from machine import Pin, I2C
+from pcf8575 import PCF8575
+from i2c_util import find_pcf8575
+
+# ======================================== 初始化配置 ===========================================
+
+i2c: I2C = I2C(id=1, sda=Pin(10), scl=Pin(11), freq=400000)
+
+# 查找PCF8575地址（优先使用缓存，必要时扫描总线）
+PCF8575_ADDRESS = find_pcf8575(i2c)
+
+# 创建PCF8575类实例
+pcf8575 = PCF8575(i2c, PCF8575_ADDRESS)
@@ -14,6 +14,15 @@ __platform__ = "MicroPython v1.23"
 # ======================================== 导入相关模块 =========================================
 
 from machine import ADC, Pin
+from micropython import const
+
+# ======================================== 全局变量 =============================================
+
+# ADC 原始值（0~65535）到电压（0~3.3V）的换算系数
+_ADC_SCALE = 3.3 / 65535
+
+# 每次读数的过采样次数，取平均以降低光敏电阻的读数噪声
+_OVERSAMPLE = const(8)
 
 class GL5516:
     """
@@ -28,7 +37,8 @@ class GL5516:
         read_light_intensity() -> tuple: 读取当前光强，返回电压值和 ADC 数值。
         set_min_light() -> int: 校准并保存当前环境为最小光强值。
         set_max_light() -> int: 校准并保存当前环境为最大光强值。
-        get_calibrated_light() -> float: 获取校准后的光强百分比（0~100%）。
+        get_calibrated_light(adc_value=None) -> float: 获取校准后的光强百分比（0~100%），可传入已读取的 ADC 数值。
+        get_light_level(adc_value=None, levels=16) -> int: 获取校准后的光强等级（0~levels），纯整数运算。
 
     Properties:
         voltage (float): 当前电压值（单位：伏特）。
@@ -40,6 +50,7 @@ class GL5516:
         校准值基于 ADC 原始数值（0~65535），对应 3.3V 电压范围。
         百分比输出为线性映射，实际光强可能与传感器非线性特性有所差异。
         建议在目标使用光照范围内进行校准以提高准确性。
+        每次读数为 8 次连续采样的整数平均值。
 
     ==========================================
     Driver for GL5516 light-dependent resistor (LDR) sensor. Supports ADC reading,
@@ -54,7 +65,8 @@ class GL5516:
         read_light_intensity() -> tuple: Read current light intensity, returns voltage and ADC value.
         set_min_light() -> int: Calibrate and save current environment as minimum light level.
         set_max_light() -> int: Calibrate and save current environment as maximum light level.
-        get_calibrated_light() -> float: Get calibrated light intensity percentage (0–100%).
+        get_calibrated_light(adc_value=None) -> float: Get calibrated light intensity percentage (0–100%), optionally from an ADC value already read.
+        get_light_level(adc_value=None, levels=16) -> int: Get calibrated light level (0–levels) using integer arithmetic only.
 
     Properties:
         voltage (float): Current voltage reading in volts.
@@ -66,6 +78,7 @@ class GL5516:
         Calibration values are based on raw ADC readings (0–65535), corresponding to 3.3V range.
         Percentage output is linear mapping; actual light intensity may differ due to sensor non-linearity.
         For best accuracy, calibrate within the intended operational lighting range.
+        Each reading is the integer mean of 8 consecutive samples.
     """
     def __init__(self, analog_pin: int):
         """
@@ -82,8 +95,76 @@ class GL5516:
         """
 
         self._analog_pin = ADC(Pin(analog_pin))
-        self.min_light = 0
-        self.max_light = 0
+        self._min_light = 0
+        self._max_light = 0
+        # 校准值变化时更新：_sign 为 max_light 相对 min_light 的方向（光敏电阻常为亮处 ADC 更小），
+        # _span 为两者差的绝对值，_inv_span = 100 / _span；两者相等时 _span 为 0
+        self._sign = 1
+        self._span = 0
+        self._inv_span = 0.0
+
+    @property
+    def min_light(self):
+        """
+        校准的最小光强参考值（ADC 原始值）。
+
+        ==========================================
+        Calibrated minimum light reference value (raw ADC).
+        """
+        return self._min_light
+
+    @min_light.setter
+    def min_light(self, value):
+        self._min_light = value
+        self._update_span()
+
+    @property
+    def max_light(self):
+        """
+        校准的最大光强参考值（ADC 原始值）。
+
+        ==========================================
+        Calibrated maximum light reference value (raw ADC).
+        """
+        return self._max_light
+
+    @max_light.setter
+    def max_light(self, value):
+        self._max_light = value
+        self._update_span()
+
+    def _update_span(self):
+        """
+        根据校准值预先计算百分比换算系数，避免每次换算做除法。
+
+        ==========================================
+        Precompute the percentage scale from the calibration values so the
+        conversion needs no division.
+        """
+        span = self._max_light - self._min_light
+        self._sign = -1 if span < 0 else 1
+        span = abs(span)
+        self._span = span
+        self._inv_span = 100.0 / span if span else 0.0
+
+    def _read_avg(self):
+        """
+        连续采样 _OVERSAMPLE 次并返回整数平均值。
+
+        Returns:
+            int: 平均后的 ADC 数值（0~65535）。
+
+        ==========================================
+        Take _OVERSAMPLE consecutive samples and return their integer mean.
+
+        Returns:
+            int: Averaged ADC value (0..65535).
+        """
+        read = self._analog_pin.read_u16
+        total = 0
+        for _ in range(_OVERSAMPLE):
+            total += read()
+        return total // _OVERSAMPLE
 
     def read_light_intensity(self):
         """
@@ -97,8 +178,9 @@ class GL5516:
         Returns:
             tuple: (voltage (float), adc_value (int))
         """
-        adc_value = self._analog_pin.read_u16()
-        voltage = self._analog_pin.read_u16() * 3.3 / 65535
+        # 电压与 ADC 数值取自同一次（过采样平均后的）读数
+        adc_value = self._read_avg()
+        voltage = adc_value * _ADC_SCALE
         return round(voltage, 2), adc_value
 
     def set_min_light(self):
@@ -113,7 +195,7 @@ class GL5516:
         Returns:
             int: ADC value of minimum light intensity.
         """
-        adc_value = self._analog_pin.read_u16()
+        adc_value = self._read_avg()
         self.min_light = adc_value
         return adc_value
 
@@ -129,28 +211,77 @@ class GL5516:
         Returns:
             int: ADC value of maximum light intensity.
         """
-        adc_value = self._analog_pin.read_u16()
+        adc_value = self._read_avg()
         self.max_light = adc_value
         return adc_value
 
-    def get_calibrated_light(self):
+    def get_calibrated_light(self, adc_value=None):
         """
         获取校准后的光强值，范围从 0 到 100%。
 
+        Args:
+            adc_value (int|None): 已读取的 ADC 数值；为 None 时重新采样。
+
         Returns:
             float: 校准后的光强百分比值。
         ==========================================
         Get calibrated light intensity value, ranging from 0 to 100%.
+
+        Args:
+            adc_value (int|None): ADC value already read; a new sample is
+                taken when None.
+
         Returns:
             float: Calibrated light intensity percentage.
         """
 
-        adc_value = self._analog_pin.read_u16()
-        if self.max_light == self.min_light:
+        if adc_value is None:
+            adc_value = self._read_avg()
+        span = self._span
+        if not span:
             return 0.0
-        light_level = (adc_value - self.min_light) / (self.max_light - self.min_light) * 100
-        light_level = max(0.0, min(100.0, light_level))
-        return light_level
+        # 在整数 ADC 域内按校准方向限幅，只有落在区间内时才做一次浮点乘法
+        offset = (adc_value - self._min_light) * self._sign
+        if offset <= 0:
+            return 0.0
+        if offset >= span:
+            return 100.0
+        return offset * self._inv_span
+
+    def get_light_level(self, adc_value=None, levels=16):
+        """
+        获取校准后的光强等级，范围从 0 到 levels，全程整数运算。
+
+        Args:
+            adc_value (int|None): 已读取的 ADC 数值；为 None 时重新采样。
+            levels (int): 满量程对应的等级数，默认 16。
+
+        Returns:
+            int: 校准后的光强等级。
+        ==========================================
+        Get calibrated light level, ranging from 0 to levels, using integer
+        arithmetic only.
+
+        Args:
+            adc_value (int|None): ADC value already read; a new sample is
+                taken when None.
+            levels (int): Level reached at full scale, 16 by default.
+
+        Returns:
+            int: Calibrated light level.
+        """
+
+        if adc_value is None:
+            adc_value = self._read_avg()
+        span = self._span
+        if not span:
+            return 0
+        offset = (adc_value - self._min_light) * self._sign
+        if offset <= 0:
+            return 0
+        if offset >= span:
+            return levels
+        return offset * levels // span
 
     # ======================================== 初始化配置 ============================================
 
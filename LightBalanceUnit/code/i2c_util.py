@@ -0,0 +1,68 @@
+# Python env   : MicroPython v1.23.0
+# -*- coding: utf-8 -*-
+# @Time    : 2025/9/18 上午10:40
+# @Author  : hogeiha
+# @File    : i2c_util.py
+# @Description : I2C辅助函数：查找PCF8575扩展芯片地址（带地址缓存）
+#                 注意：LightBalanceUnit/code 与 RhythmMusicBox/code 下各有一份本文件，内容必须保持一致。
+#                 每个工程目录单独烧录为一个固件镜像（与各自的 pcf8575.py、仅引脚不同的 bus.py 一样），
+#                 无法跨工程导入，修改时请同步另一份。
+
+# ======================================== 导入相关模块 =========================================
+
+from machine import I2C
+
+# ======================================== 全局变量 =============================================
+
+# PCF8575地址缓存文件：首次扫描到后写入，之后上电直接读取，省去整条总线的扫描
+PCF8575_ADDR_FILE = 'pcf_addr'
+
+# ======================================== 功能函数 =============================================
+
+def find_pcf8575(i2c: I2C) -> int:
+    """
+        查找PCF8575的I2C地址：优先读取地址缓存文件并向该地址发送空写探测应答，无缓存、缓存无效
+        或探测无应答（如更换了模块、改动了地址跳线）时在 0x20~0x27 范围内扫描总线，找到后重写缓存文件。
+
+    Args:
+        i2c (I2C): PCF8575所在的I2C总线。
+
+    Returns:
+        int: PCF8575的7位I2C地址。
+
+    Raises:
+        OSError: 总线上未找到PCF8575。
+
+    ==========================================
+
+    Find the PCF8575 I2C address: read the cached address file first and probe it
+    with an empty write; if the cache is missing, invalid, or the probe gets no ACK
+    (e.g. the module was swapped or its address jumpers changed), scan the bus
+    within 0x20~0x27 and rewrite the cache.
+
+    Args:
+        i2c (I2C): I2C bus the PCF8575 is attached to.
+
+    Returns:
+        int: 7-bit I2C address of the PCF8575.
+
+    Raises:
+        OSError: No PCF8575 found on the bus.
+    """
+    try:
+        with open(PCF8575_ADDR_FILE, 'rb') as f:
+            addr = f.read(1)[0]
+        if 0x20 <= addr <= 0x27:
+            # 空写探测：设备无应答时抛出 OSError，回落到总线扫描并重写缓存
+            i2c.writeto(addr, b'')
+            return addr
+    except (OSError, IndexError):
+        pass
+
+    # 只在PCF8575的地址范围（0x20~0x27）内查找，总线上有其他设备时也不会误选
+    for addr in i2c.scan():
+        if 0x20 <= addr <= 0x27:
+            with open(PCF8575_ADDR_FILE, 'wb') as f:
+                f.write(bytes((addr,)))
+            return addr
+    raise OSError("No PCF8575 found !")
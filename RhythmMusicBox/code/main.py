@@ -1,16 +1,24 @@
-from max9814_mic import MAX9814Mic
-from machine import Pin, ADC, I2C
-from ulab import numpy as np
-from ulab import scipy as spy
-from pcf8575 import PCF8575
+from machine import ADC, Timer
+from bus import pcf8575
+from micropython import const
+from array import array
+import micropython
 import time
-import math
 
-FS = 200.0                    # 采样率
+FS = const(200)              # 采样率（Hz）
 CHUNK_SIZE = 50              # 缓冲区大小
-F0 = 50.0                    # 陷波频率
-Q = 50.0                     # 品质因数
-ENVELOPE_ALPHA = 0.1         # 包络平滑系数（0-1，越小越平滑）
+ENVELOPE_ALPHA = const(26)   # 包络平滑系数，Q8定点（26/256 ≈ 0.1，越小越平滑）
+DEBUG = False                # 调试开关：为True时逐样本打印等级（串口输出远慢于采样周期）
+
+# 各亮度等级（0~16）对应的PCF8575端口值：点亮前 level+1 个LED，并互换高低字节
+# （匹配板上LED的排布顺序），导入时一次性算好，显示时只需查表
+LED_TABLE = tuple(
+    ((((1 << (l + 1)) - 1) & 0xFF) << 8) | ((((1 << (l + 1)) - 1) >> 8) & 0xFF)
+    for l in range(17)
+)
+
+# 上次写入PCF8575的端口值，数值不变时跳过I2C写入（-1表示尚未写入）
+_last_port = -1
 
 
 # 函数待补：PCF8575DBR驱动控制16个led
@@ -19,88 +27,130 @@ def display_level(level: int) -> None:
         根据 level 值点亮前 N 个 LED。
         
     """
-    pcf8575.port = x=(1 << (level + 1)) - 1
+    global _last_port
+    v = LED_TABLE[level]
+    if v != _last_port:
+        pcf8575.port = v
+        _last_port = v
         
 
-# 50Hz陷波滤波器系数（二阶节形式）
-sos_notch_50hz = np.array([
-    [0.970588235, 0.0, 0.970588235, 1.0, 0.0, 0.94117647]
-], dtype=np.float)
+# 50Hz陷波滤波器系数（二阶节形式）：[b0, b1, b2, a0, a1, a2] = [0.970588235, 0.0, 0.970588235, 1.0, 0.0, 0.94117647]
+# 只有一节且 b1 = a1 = 0，按 Q14 定点常量直接展开，由 notch_envelope 整数运算实现
+_NOTCH_B0 = const(15902)      # b0 = b2 = 0.970588235 * 2**14
+_NOTCH_A2 = const(15420)      # a2 = 0.94117647 * 2**14
+_ADC_MID = const(32768)       # ADC中点，滤波前去除直流以保证定点运算不溢出（陷波器直流增益为1，滤波后加回）
 
-print("=== 增强版包络检测 ===")
 
-adc = ADC(26)
-mic = MAX9814Mic(adc)
+@micropython.viper
+def notch_envelope(buf: ptr32, n: int, state: ptr32) -> int:
+    """
+        50Hz陷波器（直接II型转置）对 buf 前 n 个样本原地滤波，并逐样本做包络检测：
+        整流 → 最近4个样本内取最大值（峰值保持）→ 一阶低通平滑，返回本块平滑包络的峰值。
+        state 跨块保存：[0:2] 陷波器 Q14 状态量，[2:5] 前3个整流样本，[5] 低通包络。
+
+    """
+    s1 = state[0]
+    s2 = state[1]
+    r1 = state[2]
+    r2 = state[3]
+    r3 = state[4]
+    lp = state[5]
+    peak = 0
+    i = 0
+    while i < n:
+        x = buf[i] - _ADC_MID
+        y = (_NOTCH_B0 * x + s1) >> 14
+        # s1 = b1*x - a1*y + s2，其中 b1 = a1 = 0
+        s1 = s2
+        s2 = _NOTCH_B0 * x - _NOTCH_A2 * y
+        y += _ADC_MID
+        buf[i] = y
+        # 第1步：整流
+        if y < 0:
+            y = -y
+        # 第2步：4样本窗口内取最大值
+        m = y
+        if r1 > m:
+            m = r1
+        if r2 > m:
+            m = r2
+        if r3 > m:
+            m = r3
+        r3 = r2
+        r2 = r1
+        r1 = y
+        # 第3步：一阶低通 lp += ALPHA * (m - lp)，消除窗口最大值的阶梯纹波
+        lp += ((m - lp) * ENVELOPE_ALPHA) >> 8
+        if lp > peak:
+            peak = lp
+        i += 1
+    state[0] = s1
+    state[1] = s2
+    state[2] = r1
+    state[3] = r2
+    state[4] = r3
+    state[5] = lp
+    return peak
 
-# 滤波器状态
-zi = np.array([[0.0, 0.0]], dtype=np.float)
 
-# 缓冲区
-buffer = []
+print("=== 增强版包络检测 ===")
+
+adc = ADC(26)
 
-# 包络检测参数
-prev_samples = []
-window_size = 10          # 用于包络检测的窗口大小
-sample_count = 0
+# 滤波器与包络检测状态（跨块保存）：陷波器2个Q14状态量 + 峰值保持窗口3个历史样本 + 低通包络
+zi = array('i', bytes(4 * 6))
 
+# 采样双缓冲：定时器回调写满一块后切换到另一块，主循环处理已写满的那块
+# 预分配为32位整型数组，可直接交给 notch_envelope 原地滤波
+sample_bufs = (array('i', bytes(4 * CHUNK_SIZE)), array('i', bytes(4 * CHUNK_SIZE)))
+write_buf = 0             # 定时器回调当前写入的缓冲序号
+write_idx = 0             # 当前缓冲内的写入位置
+ready_buf = -1            # 已写满、待处理的缓冲序号，-1表示暂无
+# 定时器回调中直接调用 ADC.read_u16 读取麦克风（MAX9814 输出接 ADC26），每个样本少一次Python调用
+mic_read = adc.read_u16
 
 
-i2c: I2C = I2C(id=1, sda=Pin(14), scl=Pin(15), freq=400000)
+def sample_callback(t: Timer) -> None:
+    """
+        定时器回调：按固定采样率读取一次麦克风，写满 CHUNK_SIZE 个样本后交给主循环处理。
 
-# 开始扫描I2C总线上的设备，返回从机地址的列表
-devices_list: list[int] = i2c.scan()
-print('START I2C SCANNER')
+    """
+    global write_buf, write_idx, ready_buf
+    sample_bufs[write_buf][write_idx] = mic_read()
+    write_idx += 1
+    if write_idx >= CHUNK_SIZE:
+        ready_buf = write_buf
+        write_buf ^= 1
+        write_idx = 0
 
-# 若devices_list为空，则没有设备连接到I2C总线上
-if len(devices_list) == 0:
-    print("No i2c device !")
-# 若非空，则打印从机设备地址
-else:
-    print('i2c devices found:', len(devices_list))
-    # 遍历从机设备地址列表
-    for device in devices_list:
-        print("I2C hexadecimal address: ", hex(device))
-        # 假设第一个找到的设备是PCF8575
-        PCF8575_ADDRESS = device
 
-# 创建PCF8575类实例
-pcf8575 = PCF8575(i2c, PCF8575_ADDRESS)
+# 由定时器驱动采样，采样间隔不受主循环处理耗时影响
+sample_timer = Timer(-1)
+sample_timer.init(freq=FS, mode=Timer.PERIODIC, callback=sample_callback)
 
 try:
     while True:
-        raw_voltage = mic.read()
-        buffer.append(raw_voltage)
-        
-        if len(buffer) >= CHUNK_SIZE:
-            buffer_np = np.array(buffer, dtype=np.float)
-            
-            # 陷波滤波
-            filtered_np, zi = spy.signal.sosfilt(sos_notch_50hz, buffer_np, zi=zi)
-            
-            # 包络检测（使用峰值检测方法）
-            for i in range(len(buffer)):
-                # 方法1：峰值保持包络检测
-                rectified = abs(filtered_np[i])
-                
-                # 简单的峰值检测
-                prev_samples.append(rectified)
-                if len(prev_samples) > window_size:
-                    prev_samples.pop(0)
-                
-                # 取窗口内的最大值作为包络
-                envelope = max(prev_samples) if prev_samples else rectified
-                envelope = max(25000, min(60000, envelope))
-                level = int((envelope - 25000) / (60000 - 25000) * 16)
-
-                # 输出
-                #print(f"{buffer[i]:.4f},{filtered_np[i]:.4f},{envelope:.4f}")
-                print(level)
-                display_level(level)
-                sample_count += 1
-            
-            buffer = []
-        
-        time.sleep(1.0 / FS)
-        
+        # 等待定时器写满一块样本
+        if ready_buf < 0:
+            time.sleep_ms(1)
+            continue
+
+        filtered = sample_bufs[ready_buf]
+        ready_buf = -1
+
+        # 陷波滤波与包络检测（整流、峰值保持、低通平滑）在同一次原生循环中完成，取本块平滑包络的峰值，
+        # LED每块只刷新一次（约4 Hz），无需按200 Hz采样率逐样本刷新
+        envelope = notch_envelope(filtered, CHUNK_SIZE, zi)
+
+        # 限幅并量化为 0~16 级
+        envelope = max(25000, min(60000, envelope))
+        level = (envelope - 25000) * 16 // (60000 - 25000)
+
+        # 输出
+        if DEBUG:
+            print(level)
+        display_level(level)
+
 except KeyboardInterrupt:
+    sample_timer.deinit()
     print("采集停止")
\ No newline at end of file
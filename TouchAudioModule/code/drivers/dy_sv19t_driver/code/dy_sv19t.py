@@ -17,13 +17,48 @@ __platform__ = "MicroPython v1.23.0"
 # 导入 const 用于常量定义
 from micropython import const
 
+# 导入 micropython 以使用 viper 原生代码发射器
+import micropython
+
 # 导入 time 提供延时与时间控制
 import time
 
+# 导入 struct 用于 16 位数值的大端打包
+import struct
+
 # ======================================== 全局变量 ============================================
 
 # ======================================== 功能函数 ============================================
 
+@micropython.viper
+def _sum8(buf: ptr8, n: int) -> int:
+    """
+    计算 buf 前 n 个字节之和的低 8 位（帧校验和 SM）。
+
+    Args:
+        buf (bytes|bytearray|memoryview): 帧数据
+        n (int): 参与求和的字节数
+
+    Returns:
+        int: 校验和 0..255
+    ==========================================
+
+    Low 8 bits of the sum of the first n bytes of buf (frame checksum SM).
+
+    Args:
+        buf (bytes|bytearray|memoryview): Frame data
+        n (int): Number of bytes to sum
+
+    Returns:
+        int: Checksum 0..255
+    """
+    s = 0
+    i = 0
+    while i < n:
+        s += buf[i]
+        i += 1
+    return s & 0xFF
+
 # ======================================== 自定义类 ============================================
 
 
@@ -109,6 +144,31 @@ class DYSV19T:
     VOLUME_MAX = const(30)
     DEFAULT_BAUD = const(9600)
 
+    # 调试开关：为 True 时 _parse_response 额外校验帧长与起始码（_recv_response 组出的帧结构必然正确）
+    DEBUG = False
+
+    # 合法参数集合，供各设置方法做成员检查
+    _DISK_SET = frozenset((DISK_USB, DISK_SD, DISK_FLASH))
+    _MODE_SET = frozenset((
+        MODE_FULL_LOOP, MODE_SINGLE_LOOP, MODE_SINGLE_STOP, MODE_FULL_RANDOM,
+        MODE_DIR_LOOP, MODE_DIR_RANDOM, MODE_DIR_SEQUENCE, MODE_SEQUENCE,
+    ))
+    _EQ_SET = frozenset((EQ_NORMAL, EQ_POP, EQ_ROCK, EQ_JAZZ, EQ_CLASSIC))
+    _CH_SET = frozenset((CH_MP3, CH_AUX, CH_MP3_AUX))
+
+    # 路径允许的字节集合：A-Z, 0-9, '_', '/', '*', '.'
+    _PATH_CHARS = frozenset(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_/*.')
+
+    # 组合播放短名允许的字节集合：A-Z, 0-9
+    _NAME_CHARS = frozenset(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
+
+    # 无载荷指令帧缓存：AA CMD 00 SM 内容固定，导入时预先生成，发送时直接查表
+    _FRAME_CACHE = {
+        c: bytes((0xAA, c, 0x00, (0xAA + c) & 0xFF))
+        for c in (0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x09, 0x0A, 0x0C, 0x0D, 0x10, 0x11,
+                  0x12, 0x14, 0x15, 0x1C, 0x1E, 0x21, 0x24, 0x25, 0x26)
+    }
+
     def __init__(self, uart, *,
                  default_volume: int = VOLUME_MAX,
                  default_disk: int = DISK_USB,
@@ -119,7 +179,7 @@ class DYSV19T:
         初始化驱动实例；仅保存状态与参数校验，不主动向模块发命令。
 
         Args:
-            uart: UART 实例（需已配置 9600 8N1），必须具备 read()/write()
+            uart: UART 实例（需已配置 9600 8N1），必须具备 read()/write()/any()
             default_volume (int): 默认音量 0..30
             default_disk (int): 默认盘符（DISK_*）
             default_play_mode (int): 默认播放模式（MODE_*）
@@ -133,7 +193,7 @@ class DYSV19T:
         Initialize driver; only stores defaults and validates params.
 
         Args:
-            uart: UART instance (9600 8N1) providing read()/write()
+            uart: UART instance (9600 8N1) providing read()/write()/any()
             default_volume (int): 0..30
             default_disk (int): One of DISK_*
             default_play_mode (int): One of MODE_*
@@ -143,25 +203,27 @@ class DYSV19T:
         Raises:
             ValueError: If any argument is out of range or wrong type
         """
-        if uart is None or not hasattr(uart, 'read') or not hasattr(uart, 'write'):
-            raise ValueError("Invalid UART instance, must have read()/write() / 无效的UART实例")
+        if uart is None or not hasattr(uart, 'read') or not hasattr(uart, 'write') \
+                or not hasattr(uart, 'any'):
+            raise ValueError("Invalid UART instance, must have read()/write()/any() / 无效的UART实例")
         if not (self.VOLUME_MIN <= int(default_volume) <= self.VOLUME_MAX):
             raise ValueError("default_volume must be within 0..30")
-        if default_disk not in (self.DISK_USB, self.DISK_SD, self.DISK_FLASH, self.DISK_NONE):
+        if default_disk != self.DISK_NONE and default_disk not in self._DISK_SET:
             raise ValueError("default_disk must be a DISK_* constant")
-        if default_play_mode not in (
-            self.MODE_FULL_LOOP, self.MODE_SINGLE_LOOP, self.MODE_SINGLE_STOP,
-            self.MODE_FULL_RANDOM, self.MODE_DIR_LOOP, self.MODE_DIR_RANDOM,
-            self.MODE_DIR_SEQUENCE, self.MODE_SEQUENCE,
-        ):
+        if default_play_mode not in self._MODE_SET:
             raise ValueError("default_play_mode must be a MODE_* constant")
-        if default_dac_channel not in (self.CH_MP3, self.CH_AUX, self.CH_MP3_AUX):
+        if default_dac_channel not in self._CH_SET:
             raise ValueError("default_dac_channel must be a CH_* constant")
         if timeout_ms <= 0:
             raise ValueError("timeout_ms must be a positive integer")
 
         self.uart = uart
         self.timeout_ms = int(timeout_ms)
+        # 发送缓冲：按最大帧长（3 + 255 + 1）预分配，构造帧时直接写入，避免每帧分配与复制
+        self._tx_buf = bytearray(259)
+        self._tx_mv = memoryview(self._tx_buf)
+        # 串口接收缓冲：批量读入的字节先存于此，多读到的后续字节留待下次解析
+        self._rx_buf = bytearray()
 
         # 运行态属性（查询后/命令成功后由驱动维护）
         self.play_state = self.PLAY_STOP
@@ -171,9 +233,10 @@ class DYSV19T:
         self.eq = self.EQ_NORMAL
         self.dac_channel = int(default_dac_channel)
 
-    def _u16(self, value: int) -> tuple:
+    @micropython.native
+    def _u16(self, value: int) -> bytes:
         """
-        将 0..65535 转为 (H,L) 两个字节。
+        将 0..65535 按大端打包为 2 字节（H L）。
 
         Args:
             value (int): 要编码的无符号 16 位整数
@@ -182,7 +245,7 @@ class DYSV19T:
             ValueError: value 不在 0..65535
         ==========================================
 
-        Convert 0..65535 to (H, L) bytes.
+        Pack 0..65535 as 2 big-endian bytes (H L).
 
         Args:
             value (int): Unsigned 16-bit integer
@@ -193,110 +256,15 @@ class DYSV19T:
         value = int(value)
         if not (0 <= value <= 0xFFFF):
             raise ValueError("The parameter must be in the range of 0..65535")
-        return (value >> 8) & 0xFF, value & 0xFF
-
-    def _validate_disk(self, disk: int) -> int:
-        """
-        校验盘符是否为 USB/SD/FLASH。
-
-        Args:
-            disk (int): 盘符常量
-
-        Raises:
-            ValueError: 非法盘符
-        ==========================================
-
-        Validate disk is one of USB/SD/FLASH.
-
-        Args:
-            disk (int): Disk constant
-
-        Raises:
-            ValueError: If disk is invalid
-        """
-        
-        if disk not in (self.DISK_USB, self.DISK_SD, self.DISK_FLASH):
-            raise ValueError("The disk must be DISK_USB/SD/FLASH and must be online.")
-        return int(disk)
-
-    def _validate_mode(self, mode: int) -> int:
-        """
-        校验播放模式常量。
-
-        Args:
-            mode (int): 播放模式
-
-        Raises:
-            ValueError: 非法模式
-        ==========================================
-
-        Validate loop mode constant.
-
-        Args:
-            mode (int): Loop mode
-
-        Raises:
-            ValueError: If mode invalid
-        """
-        if mode not in (
-            self.MODE_FULL_LOOP, self.MODE_SINGLE_LOOP, self.MODE_SINGLE_STOP,
-            self.MODE_FULL_RANDOM, self.MODE_DIR_LOOP, self.MODE_DIR_RANDOM,
-            self.MODE_DIR_SEQUENCE, self.MODE_SEQUENCE,
-        ):
-            raise ValueError("mode must be a MODE_* constant")
-        return int(mode)
-
-    def _validate_eq(self, eq: int) -> int:
-        """
-        校验 EQ 常量。
-
-        Args:
-            eq (int): EQ 模式
-
-        Raises:
-            ValueError: 非法 EQ
-        ==========================================
-
-        Validate EQ constant.
-
-        Args:
-            eq (int): EQ mode
-
-        Raises:
-            ValueError: If eq invalid
-        """
-        if eq not in (self.EQ_NORMAL, self.EQ_POP, self.EQ_ROCK, self.EQ_JAZZ, self.EQ_CLASSIC):
-            raise ValueError("eq must be an EQ_* constant")
-        return int(eq)
+        return struct.pack('>H', value)
 
-    def _validate_channel(self, ch: int) -> int:
-        """
-        校验 DAC 输出通道常量。
-
-        Args:
-            ch (int): 通道常量
-
-        Raises:
-            ValueError: 非法通道
-        ==========================================
-
-        Validate output channel constant.
-
-            ch (int): Channel constant
-
-        Raises:
-            ValueError: If ch invalid
-        """
-        if ch not in (self.CH_MP3, self.CH_AUX, self.CH_MP3_AUX):
-            raise ValueError("ch must be a CH_* constant")
-        return int(ch)
-
-    def _validate_path(self, path: str) -> bytes:
+    def _validate_path(self, path: str, replace_dot: bool = False) -> bytes:
         """
         校验并编码路径字符串。
 
         Args:
             path (str): 目标路径（如 '/MUSIC/01.MP3' 或 '/ZH/*.WAV'）
+            replace_dot (bool): True 时在编码结果中将 '.' 替换为 '*'（协议格式符）
 
         Raises:
             ValueError: 路径为空、未以'/'起始、含非法字符或段长非法
@@ -306,6 +274,7 @@ class DYSV19T:
 
         Args:
             path (str): Path such as '/MUSIC/01.MP3' or '/ZH/*.WAV'
+            replace_dot (bool): If True, '.' is replaced by '*' (protocol formatter) in the encoded result
 
         Raises:
             ValueError: If empty, not starting with '/', contains invalid chars, or segment length invalid
@@ -314,67 +283,61 @@ class DYSV19T:
             raise ValueError("The path must start with '/'")
         if path[0] != '/':
             raise ValueError("The path must start with '/'")
+        pb = path.encode('ascii')
         # 允许的字符集：A-Z, 0-9, '_', '/', '*', '.'
-        for ch in path:
-            o = ord(ch)
-            if ch in ('/', '*', '.'):
-                continue
-            if ch == '_':
-                continue
-            if 48 <= o <= 57:  # 0-9
-                continue
-            if 65 <= o <= 90:  # A-Z
-                continue
+        if not self._PATH_CHARS.issuperset(pb):
             raise ValueError("path contains illegal characters: only A-Z/0-9/_, and protocol formatters '*', '.', '/' are allowed")
-        # 校验每段（按 '/' 分割的文件夹名）长度 1..8；'*' 属于格式符不过不作为段内容校验
-        seg = ""
-        for ch in path[1:]:  # 跳过开头 '/'
-            if ch == '/':
-                if not (1 <= len(seg) <= 8):
-                    raise ValueError("The length of the folder name must be 1..8 bytes")
-                seg = ""
-            elif ch in ('*', '.'):
-                # 到达文件名或扩展名格式区，结束文件夹段校验
-                break
-            else:
-                seg += ch
-        return path.encode('ascii')
-
-    def _build_frame(self, cmd: int, data: bytes) -> bytes:
-        """
-        构造完整帧：AA CMD LEN DATA... SM
+        # 校验每段（以 '/' 结尾的文件夹名）长度 1..8；到达 '*' 或 '.' 即进入文件名/扩展名格式区，结束校验
+        stop = len(pb)
+        for fmt in (b'*', b'.'):
+            i = pb.find(fmt)
+            if 0 <= i < stop:
+                stop = i
+        for seg in pb[1:stop].split(b'/')[:-1]:
+            if not (1 <= len(seg) <= 8):
+                raise ValueError("The length of the folder name must be 1..8 bytes")
+        # '.' 与 '*' 在校验规则中等价，替换直接在编码后的字节串上进行
+        return pb.replace(b'.', b'*') if replace_dot else pb
+
+    @micropython.native
+    def _build_frame(self, cmd: int, data: bytes) -> memoryview:
+        """
+        构造完整帧：AA CMD LEN DATA... SM。帧写入实例内复用的发送缓冲，返回其切片视图，
+        下一次构造帧时内容会被覆盖，需立即写出（或自行 bytes() 复制后保存）。
 
         Args:
             cmd (int): 命令码
             data (bytes): 载荷数据
 
         Raises:
-            ValueError: data 非 bytes/bytearray 类型
+            ValueError: data 非 bytes/bytearray 类型或长度超过 255
         ==========================================
 
-        Build a complete frame: AA CMD LEN DATA... SM
+        Build a complete frame: AA CMD LEN DATA... SM. The frame is written into
+        the reused per-instance TX buffer and a view of it is returned; it is
+        overwritten by the next build, so write it out immediately (or copy it
+        with bytes() to keep it).
 
-        
             cmd (int): Command code
             data (bytes): Payload data
 
         Raises:
-            ValueError: If data is not bytes/bytearray
+            ValueError: If data is not bytes/bytearray or longer than 255 bytes
         """
         cmd = int(cmd)
         if not isinstance(data, (bytes, bytearray)):
             raise ValueError("data 必须为 bytes/bytearray")
-        frame = bytearray(3 + len(data) + 1)
+        n = len(data)
+        if n > 255:
+            raise ValueError("data 长度不能超过 255 字节")
+        frame = self._tx_buf
         frame[0] = 0xAA
         frame[1] = cmd
-        frame[2] = len(data)
+        frame[2] = n
         if data:
-            frame[3:3+len(data)] = data
-        sm = 0
-        for b in frame[:-1]:
-            sm = (sm + b) & 0xFF
-        frame[-1] = sm
-        return bytes(frame)
+            frame[3:3+n] = data
+        frame[3+n] = _sum8(frame, 3 + n)
+        return self._tx_mv[:4+n]
 
     def _parse_response(self, resp: bytes):
         """
@@ -384,26 +347,24 @@ class DYSV19T:
             resp (bytes): 原始响应帧字节序列
 
         Raises:
-            ValueError: 响应过短、起始码错误、长度不匹配或校验和不匹配
+            ValueError: 校验和不匹配；DEBUG 为 True 时另校验响应过短、起始码错误、长度不匹配
         ==========================================
 
         Parse & validate response frame, return {'cmd': int, 'data': bytes}.
 
         Raises:
-            ValueError: If too short, bad start byte, length mismatch, or checksum mismatch
-        """
-        if not resp or len(resp) < 4:
-            raise ValueError("The response is too short.")
-        if resp[0] != 0xAA:
-            raise ValueError("Initial code error")
+            ValueError: On checksum mismatch; with DEBUG also if too short, bad start byte, or length mismatch
+        """
+        if self.DEBUG:
+            if not resp or len(resp) < 4:
+                raise ValueError("The response is too short.")
+            if resp[0] != 0xAA:
+                raise ValueError("Initial code error")
+            if len(resp) != 4 + resp[2]:  # AA CMD LEN DATA(n) SM
+                raise ValueError("Length mismatch")
         cmd = resp[1]
         n   = resp[2]
-        if len(resp) != 4 + n - 0:  # AA CMD LEN DATA(n) SM
-            raise ValueError("Length mismatch")
-        sm = 0
-        for b in resp[:-1]:
-            sm = (sm + b) & 0xFF
-        if sm != resp[-1]:
+        if _sum8(resp, len(resp) - 1) != resp[-1]:
             raise ValueError("The volume must be between 0..30")
         data = resp[3:3+n] if n else b""
         return {'cmd': cmd, 'data': data}
@@ -431,40 +392,55 @@ class DYSV19T:
         """
         if timeout_ms is None:
             timeout_ms = self.timeout_ms
-        t0 = time.ticks_ms()
-        buf = bytearray()
-        state = 0  # 0: seek AA, 1: got AA, waiting CMD/LEN/DATA/SM
-        need = 0
-        while time.ticks_diff(time.ticks_ms(), t0) < timeout_ms:
-            b = self.uart.read(1)
-            if not b:
+        # 循环中反复调用的函数预先绑定为局部名，省去模块/实例属性查找
+        ticks_ms = time.ticks_ms
+        ticks_diff = time.ticks_diff
+        ticks_add = time.ticks_add
+        sleep_ms = time.sleep_ms
+        uart_any = self.uart.any
+        uart_read = self.uart.read
+        parse = self._parse_response
+        # 超时截止时刻，只在进入时计算一次
+        deadline = ticks_add(ticks_ms(), timeout_ms)
+        buf = self._rx_buf
+        while True:
+            # 从缓冲中提取完整帧
+            while True:
+                # 丢弃起始码 AA 之前的无效字节
+                i = 0
+                while i < len(buf) and buf[i] != 0xAA:
+                    i += 1
+                if i:
+                    buf = buf[i:]
+                if len(buf) < 3:
+                    break
+                need = 4 + buf[2]  # total length including SM
+                if len(buf) < need:
+                    break
+                frame = bytes(buf[:need])
+                try:
+                    parsed = parse(frame)
+                except ValueError:
+                    # 校验失败：跳过该起始码，从下一字节重新寻找
+                    buf = buf[1:]
+                    continue
+                buf = buf[need:]
+                if (expected_cmd is None) or (parsed['cmd'] == expected_cmd):
+                    self._rx_buf = buf
+                    return frame
+                # 不匹配继续寻找下一帧
+            if ticks_diff(deadline, ticks_ms()) <= 0:
+                self._rx_buf = buf
+                return None
+            # 一次读出串口中已到达的全部字节
+            n = uart_any()
+            if n:
+                chunk = uart_read(n)
+                if chunk:
+                    buf.extend(chunk)
+            else:
                 # 小睡一会儿避免空转
-                time.sleep_ms(1)
-                continue
-            x = b[0]
-            if state == 0:
-                if x == 0xAA:
-                    buf = bytearray([0xAA])
-                    state = 1
-            elif state == 1:
-                buf.append(x)
-                if len(buf) == 3:
-                    need = 4 + buf[2]  # total length including SM
-                if len(buf) >= 3 and len(buf) == need:
-                    # 完整帧到达
-                    try:
-                        parsed = self._parse_response(buf)
-                    except ValueError:
-                        # 丢弃并重新寻找起始
-                        state = 0
-                        buf = bytearray()
-                        continue
-                    if (expected_cmd is None) or (parsed['cmd'] == expected_cmd):
-                        return bytes(buf)
-                    # 不匹配继续寻找下一帧
-                    state = 0
-                    buf = bytearray()
-        return None
+                sleep_ms(1)
 
     def _send_frame(self, cmd: int):
         """
@@ -485,9 +461,13 @@ class DYSV19T:
         Raises:
             IOError: May be raised by underlying UART write
         """
-        # 发送无数据的通用命令
+        # 发送无数据的通用命令：优先使用缓存帧，未缓存的命令码首次发送时生成并缓存
+        frm = self._FRAME_CACHE.get(cmd)
+        if frm is None:
+            frm = bytes(self._build_frame(cmd, b""))
+            self._FRAME_CACHE[cmd] = frm
         try:
-            self.uart.write(self._build_frame(cmd, b""))
+            self.uart.write(frm)
         except IOError as e:
             raise IOError("UART Write failed") from e
 
@@ -566,13 +546,13 @@ class DYSV19T:
             track_no (int): Track number 1..65535
             play (bool): True to play now, False to preselect only
         """
-        # 验证track_no 输出H,L
-        H, L = self._u16(track_no)
+        # 验证track_no 并打包为 H,L
+        hl = self._u16(track_no)
         if play:
-            self.uart.write(self._build_frame(0x07, bytes([H, L])))
+            self.uart.write(self._build_frame(0x07, hl))
             self.play_state = self.PLAY_PLAY
         else:
-            self.uart.write(self._build_frame(0x1F, bytes([H, L])))
+            self.uart.write(self._build_frame(0x1F, hl))
 
     def play_disk_path(self, disk: int, path: str):
         """
@@ -589,11 +569,12 @@ class DYSV19T:
             disk (int): One of DISK_*
             path (str): Path like '/DIR/NAME.MP3'
         """
-        path = path.replace('.', '*')
         # 校验盘符
-        d = self._validate_disk(disk)
+        if disk not in self._DISK_SET:
+            raise ValueError("The disk must be DISK_USB/SD/FLASH and must be online.")
+        d = int(disk)
         # 校验路径
-        pb = self._validate_path(path)
+        pb = self._validate_path(path, replace_dot=True)
         self.uart.write(self._build_frame(0x08, bytes([d]) + pb))
         self.play_state = self.PLAY_PLAY
         self.current_disk = d
@@ -616,10 +597,14 @@ class DYSV19T:
 
         """
         # 校验盘符
-        d = self._validate_disk(disk)
-        # 校验track_no 处理出H,L
-        H, L = self._u16(track_no)
-        self.uart.write(self._build_frame(0x16, bytes([d, H, L])))
+        if disk not in self._DISK_SET:
+            raise ValueError("The disk must be DISK_USB/SD/FLASH and must be online.")
+        d = int(disk)
+        # 校验track_no，与盘符一起打包为 disk,H,L
+        track_no = int(track_no)
+        if not (0 <= track_no <= 0xFFFF):
+            raise ValueError("The parameter must be in the range of 0..65535")
+        self.uart.write(self._build_frame(0x16, struct.pack('>BH', d, track_no)))
 
     def insert_path(self, disk: int, path: str):
         """
@@ -638,11 +623,12 @@ class DYSV19T:
             disk (int): One of DISK_*
             path (str): Path (must start with '/')
         """
-        path = path.replace('.', '*')
-        # 验证文件
-        d = self._validate_disk(disk)
+        # 验证盘符
+        if disk not in self._DISK_SET:
+            raise ValueError("The disk must be DISK_USB/SD/FLASH and must be online.")
+        d = int(disk)
         # 验证路径
-        pb = self._validate_path(path)
+        pb = self._validate_path(path, replace_dot=True)
         self.uart.write(self._build_frame(0x17, bytes([d]) + pb))
 
     def end_insert(self):
@@ -719,7 +705,9 @@ class DYSV19T:
 
         """
         # 验证eq
-        e = self._validate_eq(eq)
+        if eq not in self._EQ_SET:
+            raise ValueError("eq must be an EQ_* constant")
+        e = int(eq)
         self.uart.write(self._build_frame(0x1A, bytes([e])))
         self.eq = e
 
@@ -737,7 +725,9 @@ class DYSV19T:
             ch (int): One of CH_*
         """
         # 校验 DAC 输出通道常量
-        c = self._validate_channel(ch)
+        if ch not in self._CH_SET:
+            raise ValueError("ch must be a CH_* constant")
+        c = int(ch)
         self.uart.write(self._build_frame(0x1D, bytes([c])))
         self.dac_channel = c
 
@@ -758,7 +748,9 @@ class DYSV19T:
 
         """
         # 校验播放模式
-        m = self._validate_mode(mode)
+        if mode not in self._MODE_SET:
+            raise ValueError("mode must be a MODE_* constant")
+        m = int(mode)
         self.uart.write(self._build_frame(0x18, bytes([m])))
         self.play_mode = m
 
@@ -781,9 +773,8 @@ class DYSV19T:
         Raises:
             ValueError: If count out of range or current mode unsupported
         """
-        # 验证count 并且输出H,L
-        H, L = self._u16(count)
-        self.uart.write(self._build_frame(0x19, bytes([H, L])))
+        # 验证count 并打包为 H,L
+        self.uart.write(self._build_frame(0x19, self._u16(count)))
         if self.play_mode in ( 0x02, 0x03, 0x05, 0x06, 0x07):
             # 单曲停止、全盘随机、目录随机、目录顺序、全盘
             raise ValueError("The playback mode is incorrect, it supports \n(MODE_FULL_LOOP, MODE_SINGLE_LOOP, MODE_DIR_LOOP, MODE_SEQUENCE)")
@@ -846,9 +837,8 @@ class DYSV19T:
             seconds (int): 0..65535
 
         """
-        # 验证seconds 并且输出H,L
-        H, L = self._u16(seconds)
-        self.uart.write(self._build_frame(0x22, bytes([H, L])))
+        # 验证seconds 并打包为 H,L
+        self.uart.write(self._build_frame(0x22, self._u16(seconds)))
 
     def seek_forward(self, seconds: int):
         """
@@ -865,9 +855,8 @@ class DYSV19T:
             seconds (int): 0..65535
 
         """
-        # 验证seconds 并且输出H,L
-        H, L = self._u16(seconds)
-        self.uart.write(self._build_frame(0x23, bytes([H, L])))
+        # 验证seconds 并打包为 H,L
+        self.uart.write(self._build_frame(0x23, self._u16(seconds)))
 
     # 查询类（解析并更新属性；超时返回 None）
     def query_status(self):
@@ -1055,17 +1044,19 @@ class DYSV19T:
         """
         if not isinstance(short_names, (list, tuple)) or not short_names:
             raise ValueError("short_names 必须为非空列表")
-        bb = bytearray()
+        # 按短名个数预分配载荷，逐个校验后写入对应位置，最后一次性组帧发送
+        bb = bytearray(2 * len(short_names))
+        i = 0
         for s in short_names:
             if not isinstance(s, str) or len(s) != 2:
                 raise ValueError("The  name must be a 2-byte string, for example '01'")
+            nb = s.encode('ascii')
             # 仅允许 A-Z/0-9
-            for ch in s:
-                o = ord(ch)
-                if not (48 <= o <= 57 or 65 <= o <= 90):
-                    raise ValueError(" names are only allowed to contain A-Z or 0-9")
-            bb.extend(s.encode('ascii'))
-        self.uart.write(self._build_frame(0x1B, bytes(bb)))
+            if not self._NAME_CHARS.issuperset(nb):
+                raise ValueError(" names are only allowed to contain A-Z or 0-9")
+            bb[i:i+2] = nb
+            i += 2
+        self.uart.write(self._build_frame(0x1B, bb))
 
     def end_combination_playlist(self):
         """